@@ -3,17 +3,93 @@ Analytics module for social media dashboard.
 Provides aggregations, metrics, and data analysis functions.
 """
 
+import re
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 import networkx as nx
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from scipy import sparse
+    from scipy.sparse import csgraph
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+
+# Common words excluded from keyword extraction
+STOP_WORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 
+    'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
+    'before', 'after', 'above', 'below', 'between', 'among', 'this',
+    'that', 'these', 'those', 'are', 'was', 'were', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'shall', 'not', 'what',
+    'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each',
+    'few', 'more', 'most', 'other', 'some', 'such', 'only', 'own',
+    'same', 'so', 'than', 'too', 'very', 'just', 'now', 'here',
+    'there', 'then', 'them', 'they', 'their', 'his', 'her', 'its',
+    'our', 'your', 'you', 'we', 'he', 'she', 'it', 'me', 'him',
+    'us', 'my', 'mine', 'yours', 'ours', 'theirs'
+})
+
+# Candidate keywords: standalone runs of four or more letters in lowercased text
+KEYWORD_PATTERN = re.compile(r'\b[a-z]{4,}\b')
+
+DAYS_OF_WEEK = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Low-cardinality columns stored as categoricals so groupby and isin work on integer codes
+CATEGORICAL_COLUMNS = ('author', 'subreddit', 'platform')
+
+# Rows per worker chunk when counting author-subreddit pairs in parallel;
+# smaller inputs are counted serially since process overhead would dominate
+PAIR_COUNT_CHUNK_ROWS = 100_000
+
+# Prebuilt empty results, copied when a filter leaves nothing to analyze
+_EMPTY_TIME_SERIES = pd.DataFrame(columns=['date', 'post_count'])
+_EMPTY_KEYWORD_TRENDS = pd.DataFrame(columns=['created_at', 'count', 'keyword'])
+_EMPTY_CONTRIBUTORS = pd.DataFrame(columns=['author', 'post_count', 'percentage'])
+_EMPTY_PAIR_COUNTS = pd.DataFrame(columns=['author', 'subreddit', 'post_count'])
+_EMPTY_RHYTHM = pd.DataFrame(columns=['day_of_week', 'post_count'])
+
+
+@lru_cache(maxsize=32)
+def _build_keyword_automaton(patterns: Tuple[str, ...]) -> "ahocorasick.Automaton":
+    """Build (and cache) an Aho-Corasick automaton matching the given keywords."""
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_author_subreddit_pairs(data: pd.DataFrame) -> pd.Series:
+    """Count posts per (author, subreddit) pair."""
+    return data.groupby(['author', 'subreddit'], observed=True).size()
+
 
 class SocialMediaAnalytics:
     """Handles analytics and metrics calculation for social media data."""
     
     def __init__(self, data: pd.DataFrame):
-        self.data = data
+        self.data = data.astype({col: 'category' for col in CATEGORICAL_COLUMNS})
+        self._row_tokens = None
     
     def get_summary_stats(self, filtered_data: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -66,15 +142,32 @@ class SocialMediaAnalytics:
             DataFrame with time series data
         """
         if filtered_data.empty or filtered_data['created_at'].isna().all():
-            return pd.DataFrame(columns=['date', 'post_count'])
+            return _EMPTY_TIME_SERIES.copy()
+        
+        offset = pd.tseries.frequencies.to_offset(freq)
+        if not isinstance(offset, (pd.offsets.Tick, pd.offsets.Day)):
+            # Calendar frequencies (weeks, months) need pandas' anchored binning
+            time_series = (filtered_data.groupby(pd.Grouper(key='created_at', freq=freq))
+                          .size()
+                          .reset_index(name='post_count'))
+            
+            time_series['date'] = time_series['created_at']
+            return time_series[['date', 'post_count']]
+        
+        # Fixed-width periods: bin timestamps directly with integer arithmetic,
+        # anchoring bins at midnight of the first day as pd.Grouper does
+        timestamps = filtered_data['created_at'].to_numpy()
+        timestamps = timestamps[~np.isnat(timestamps)]
+        step = np.timedelta64(offset.nanos, 'ns').astype(timestamps.dtype.str.replace('M8', 'm8'))
+        
+        first = timestamps.min()
+        first_day = first.astype('datetime64[D]').astype(timestamps.dtype)
+        start = first_day + ((first - first_day) // step) * step
         
-        # Group by time period
-        time_series = (filtered_data.groupby(pd.Grouper(key='created_at', freq=freq))
-                      .size()
-                      .reset_index(name='post_count'))
+        post_counts = np.bincount((timestamps - start) // step)
+        dates = start + np.arange(len(post_counts)) * step
         
-        time_series['date'] = time_series['created_at']
-        return time_series[['date', 'post_count']]
+        return pd.DataFrame({'date': dates, 'post_count': post_counts})
     
     def get_top_keywords(self, filtered_data: pd.DataFrame, 
                         top_n: int = 10) -> List[Tuple[str, int]]:
@@ -91,34 +184,62 @@ class SocialMediaAnalytics:
         if filtered_data.empty:
             return []
         
-        # Combine all text
-        all_text = ' '.join(filtered_data['combined_text'].fillna(''))
-        
-        # Simple keyword extraction (split on whitespace and punctuation)
-        import re
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', all_text.lower())
-        
-        # Filter out common stop words
-        stop_words = {
-            'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 
-            'with', 'by', 'from', 'up', 'about', 'into', 'through', 'during',
-            'before', 'after', 'above', 'below', 'between', 'among', 'this',
-            'that', 'these', 'those', 'are', 'was', 'were', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'must', 'can', 'shall', 'not', 'what',
-            'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each',
-            'few', 'more', 'most', 'other', 'some', 'such', 'only', 'own',
-            'same', 'so', 'than', 'too', 'very', 'just', 'now', 'here',
-            'there', 'then', 'them', 'they', 'their', 'his', 'her', 'its',
-            'our', 'your', 'you', 'we', 'he', 'she', 'it', 'me', 'him',
-            'us', 'my', 'mine', 'yours', 'ours', 'theirs'
-        }
-        
-        filtered_words = [word for word in words if word not in stop_words and len(word) > 3]
+        positions = self._dataset_positions(filtered_data)
+        if positions is not None:
+            # Reuse the tokens cached for the full dataset
+            filtered_tokens = self._get_row_tokens().iloc[positions]
+        else:
+            filtered_tokens = filtered_data['combined_text'].fillna('').map(self._tokenize)
         
         # Count and return top keywords
-        word_counts = Counter(filtered_words)
-        return word_counts.most_common(top_n)
+        word_counts = Counter(chain.from_iterable(filtered_tokens))
+        return self._most_common(word_counts, top_n)
+    
+    def _most_common(self, counts: Counter, n: int) -> List[Tuple[str, int]]:
+        """Return the n most common items, using a single max() scan when n is 1."""
+        if n == 1:
+            return [max(counts.items(), key=itemgetter(1))] if counts else []
+        return counts.most_common(n)
+    
+    def _tokenize(self, text: str) -> List[str]:
+        """Split already-lowercased text into keywords, dropping stop words and short words."""
+        return [word for word in KEYWORD_PATTERN.findall(text) if word not in STOP_WORDS]
+    
+    def _dataset_positions(self, filtered_data: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        Locate the rows of a frame in the full dataset, if it is a row subset of it.
+        
+        Matching index labels are not enough, since a frame built elsewhere can
+        reuse them, so the rows' text must also equal the dataset's text.
+        
+        Args:
+            filtered_data: Filtered DataFrame
+            
+        Returns:
+            Row positions in the full dataset, or None if the rows do not match
+        """
+        if not self.data.index.is_unique:
+            return None
+        
+        positions = self.data.index.get_indexer(filtered_data.index)
+        if (positions < 0).any():
+            return None
+        
+        dataset_text = self.data['combined_text'].iloc[positions].reset_index(drop=True)
+        if not dataset_text.equals(filtered_data['combined_text'].reset_index(drop=True)):
+            return None
+        return positions
+    
+    def _get_row_tokens(self) -> pd.Series:
+        """
+        Tokenize every post in the full dataset once and cache the result.
+        
+        Returns:
+            Series of keyword lists aligned with the dataset index
+        """
+        if self._row_tokens is None:
+            self._row_tokens = self.data['combined_text'].fillna('').map(self._tokenize)
+        return self._row_tokens
     
     def get_keyword_time_series(self, filtered_data: pd.DataFrame, 
                                keywords: List[str], freq: str = 'D') -> pd.DataFrame:
@@ -136,26 +257,71 @@ class SocialMediaAnalytics:
         if filtered_data.empty or not keywords:
             return pd.DataFrame()
         
-        results = []
+        keyword_masks = self._match_keywords(filtered_data['combined_text'], keywords)
+        if not any(mask.any() for mask in keyword_masks.values()):
+            return _EMPTY_KEYWORD_TRENDS.copy()
         
-        for keyword in keywords:
-            # Filter posts containing the keyword
-            keyword_posts = filtered_data[
-                filtered_data['combined_text'].str.contains(keyword.lower(), na=False)
-            ]
+        # Count matches for every keyword with a single time grouping
+        hits = pd.DataFrame(
+            {i: keyword_masks[keyword.lower()] for i, keyword in enumerate(keywords)},
+            index=pd.DatetimeIndex(filtered_data['created_at'])
+        )
+        counts = hits.groupby(pd.Grouper(freq=freq)).sum()
+        
+        results = []
+        for i, keyword in enumerate(keywords):
+            keyword_counts = counts[i]
+            active = keyword_counts.to_numpy().nonzero()[0]
             
-            if not keyword_posts.empty:
-                # Group by time period
-                time_series = (keyword_posts.groupby(pd.Grouper(key='created_at', freq=freq))
-                              .size()
-                              .reset_index(name='count'))
-                time_series['keyword'] = keyword
-                results.append(time_series)
+            if len(active) > 0:
+                # Keep the periods between the keyword's first and last mention
+                span = keyword_counts.iloc[active[0]:active[-1] + 1]
+                results.append(pd.DataFrame({
+                    'created_at': span.index,
+                    'count': span.to_numpy(),
+                    'keyword': keyword
+                }))
         
         if results:
             return pd.concat(results, ignore_index=True)
         else:
-            return pd.DataFrame(columns=['created_at', 'count', 'keyword'])
+            return _EMPTY_KEYWORD_TRENDS.copy()
+    
+    def _match_keywords(self, texts: pd.Series, keywords: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Find which posts contain each keyword.
+        
+        With pyahocorasick installed, all keywords are matched in a single pass
+        over the text; otherwise each keyword is searched for separately.
+        
+        Args:
+            texts: Lowercased post text
+            keywords: Keywords to look for
+            
+        Returns:
+            Dictionary mapping each lowercased keyword to a boolean mask over texts
+        """
+        patterns = {keyword.lower() for keyword in keywords}
+        
+        if not AHOCORASICK_AVAILABLE:
+            return {
+                pattern: texts.str.contains(pattern, na=False, regex=False).to_numpy()
+                for pattern in patterns
+            }
+        
+        automaton = _build_keyword_automaton(tuple(sorted(patterns)))
+        
+        # Collect the set of keywords found in each post
+        matched = [
+            {pattern for _, pattern in automaton.iter(text)} if isinstance(text, str) else set()
+            for text in texts
+        ]
+        
+        return {
+            pattern: np.fromiter((pattern in found for found in matched),
+                                 dtype=bool, count=len(matched))
+            for pattern in patterns
+        }
     
     def get_top_contributors(self, filtered_data: pd.DataFrame, 
                            top_n: int = 10) -> pd.DataFrame:
@@ -170,10 +336,10 @@ class SocialMediaAnalytics:
             DataFrame with contributor statistics
         """
         if filtered_data.empty:
-            return pd.DataFrame(columns=['author', 'post_count', 'percentage'])
+            return _EMPTY_CONTRIBUTORS.copy()
         
         # Count posts per author
-        author_counts = (filtered_data.groupby('author')
+        author_counts = (filtered_data.groupby('author', observed=True)
                         .agg({
                             'id': 'count',
                             'score': 'mean',
@@ -209,53 +375,140 @@ class SocialMediaAnalytics:
         if filtered_data.empty:
             return G
         
-        # Get top authors by post count
-        top_author_list = (filtered_data.groupby('author')
-                          .size()
-                          .sort_values(ascending=False)
-                          .head(top_authors)
-                          .index.tolist())
+        if SCIPY_AVAILABLE and all(
+            isinstance(filtered_data[col].dtype, pd.CategoricalDtype) for col in ('author', 'subreddit')
+        ):
+            author_subreddit_counts = self._count_top_pairs_sparse(
+                filtered_data, top_authors, top_subreddits
+            )
+        else:
+            author_subreddit_counts = self._count_top_pairs(
+                filtered_data, top_authors, top_subreddits
+            )
+        
+        if author_subreddit_counts.empty:
+            return G
         
-        # Get top subreddits by post count
-        top_subreddit_list = (filtered_data.groupby('subreddit')
-                             .size()
-                             .sort_values(ascending=False)
-                             .head(top_subreddits)
-                             .index.tolist())
+        authors = author_subreddit_counts['author'].tolist()
+        subreddits = author_subreddit_counts['subreddit'].tolist()
+        post_counts = author_subreddit_counts['post_count'].tolist()
+        
+        # Add nodes with attributes, prefixing names to distinguish the two node types
+        G.add_nodes_from(
+            (f"👤 {author}", {'node_type': 'author', 'label': author})
+            for author in dict.fromkeys(authors)
+        )
+        G.add_nodes_from(
+            (f"📋 r/{subreddit}", {'node_type': 'subreddit', 'label': f"r/{subreddit}"})
+            for subreddit in dict.fromkeys(subreddits)
+        )
+        
+        # Add edges with weight based on post count
+        G.add_edges_from(
+            (f"👤 {author}", f"📋 r/{subreddit}", {'weight': post_count, 'post_count': post_count})
+            for author, subreddit, post_count in zip(authors, subreddits, post_counts)
+        )
+        
+        return G
+    
+    def _count_top_pairs(self, filtered_data: pd.DataFrame,
+                         top_authors: int, top_subreddits: int) -> pd.DataFrame:
+        """
+        Count posts per author-subreddit pair among the top authors and subreddits.
+        
+        Args:
+            filtered_data: Filtered DataFrame
+            top_authors: Number of top authors to include
+            top_subreddits: Number of top subreddits to include
+            
+        Returns:
+            DataFrame with 'author', 'subreddit' and 'post_count' columns
+        """
+        # Get top authors and subreddits by post count
+        top_author_list = filtered_data['author'].value_counts().head(top_authors).index.tolist()
+        top_subreddit_list = filtered_data['subreddit'].value_counts().head(top_subreddits).index.tolist()
         
         # Filter data to only include top authors and subreddits
         filtered_top_data = filtered_data[
-            (filtered_data['author'].isin(top_author_list)) &
-            (filtered_data['subreddit'].isin(top_subreddit_list))
+            self._isin_mask(filtered_data['author'], top_author_list) &
+            self._isin_mask(filtered_data['subreddit'], top_subreddit_list)
         ]
         
         if filtered_top_data.empty:
-            return G
+            return _EMPTY_PAIR_COUNTS.copy()
         
         # Count posts per author-subreddit combination
-        author_subreddit_counts = (filtered_top_data.groupby(['author', 'subreddit'])
-                                 .size()
-                                 .reset_index(name='post_count'))
+        if JOBLIB_AVAILABLE and len(filtered_top_data) > PAIR_COUNT_CHUNK_ROWS:
+            pairs = filtered_top_data[['author', 'subreddit']]
+            partial_counts = Parallel(n_jobs=-1)(
+                delayed(_count_author_subreddit_pairs)(pairs.iloc[start:start + PAIR_COUNT_CHUNK_ROWS])
+                for start in range(0, len(pairs), PAIR_COUNT_CHUNK_ROWS)
+            )
+            pair_counts = pd.concat(partial_counts).groupby(level=[0, 1], observed=True).sum()
+        else:
+            pair_counts = _count_author_subreddit_pairs(filtered_top_data)
+        
+        author_subreddit_counts = pair_counts.reset_index(name='post_count')
         
         # Only include connections with at least 1 post (automatic filtering)
-        author_subreddit_counts = author_subreddit_counts[
-            author_subreddit_counts['post_count'] >= 1
-        ]
+        return author_subreddit_counts[author_subreddit_counts['post_count'] >= 1]
+    
+    def _isin_mask(self, values: pd.Series, targets: List[Any]) -> np.ndarray:
+        """Boolean mask of values found in targets, comparing integer codes for categoricals."""
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            target_codes = values.cat.categories.get_indexer(targets)
+            return np.isin(values.cat.codes.to_numpy(), target_codes[target_codes >= 0])
+        return values.isin(targets).to_numpy()
+    
+    def _count_top_pairs_sparse(self, filtered_data: pd.DataFrame,
+                                top_authors: int, top_subreddits: int) -> pd.DataFrame:
+        """
+        Sparse-matrix version of _count_top_pairs for categorical author/subreddit columns.
         
-        # Add nodes and edges
-        for _, row in author_subreddit_counts.iterrows():
-            author = f"👤 {row['author']}"  # Prefix to distinguish authors
-            subreddit = f"📋 r/{row['subreddit']}"  # Prefix to distinguish subreddits
-            post_count = row['post_count']
-            
-            # Add nodes with attributes
-            G.add_node(author, node_type='author', label=row['author'])
-            G.add_node(subreddit, node_type='subreddit', label=f"r/{row['subreddit']}")
-            
-            # Add edge with weight based on post count
-            G.add_edge(author, subreddit, weight=post_count, post_count=post_count)
+        Builds an author x subreddit co-occurrence matrix straight from the
+        category codes, then reads post totals and pair counts off it.
         
-        return G
+        Args:
+            filtered_data: Filtered DataFrame with categorical 'author' and 'subreddit'
+            top_authors: Number of top authors to include
+            top_subreddits: Number of top subreddits to include
+            
+        Returns:
+            DataFrame with 'author', 'subreddit' and 'post_count' columns
+        """
+        author_values = filtered_data['author'].cat
+        subreddit_values = filtered_data['subreddit'].cat
+        author_codes = author_values.codes.to_numpy()
+        subreddit_codes = subreddit_values.codes.to_numpy()
+        
+        # Rank authors and subreddits by post count (missing values have code -1),
+        # then sort the selected codes so pairs come out in groupby's order
+        top_author_codes = np.sort(
+            self._top_codes(author_codes, len(author_values.categories), top_authors)
+        )
+        top_subreddit_codes = np.sort(
+            self._top_codes(subreddit_codes, len(subreddit_values.categories), top_subreddits)
+        )
+        
+        valid = (author_codes >= 0) & (subreddit_codes >= 0)
+        cooccurrence = sparse.csr_matrix(
+            (np.ones(valid.sum(), dtype=np.int64), (author_codes[valid], subreddit_codes[valid])),
+            shape=(len(author_values.categories), len(subreddit_values.categories))
+        )
+        
+        top_pairs = cooccurrence[top_author_codes][:, top_subreddit_codes].tocoo()
+        top_pairs.sum_duplicates()
+        
+        return pd.DataFrame({
+            'author': author_values.categories[top_author_codes[top_pairs.row]],
+            'subreddit': subreddit_values.categories[top_subreddit_codes[top_pairs.col]],
+            'post_count': top_pairs.data
+        })
+    
+    def _top_codes(self, codes: np.ndarray, n_categories: int, top_n: int) -> np.ndarray:
+        """Return the category codes of the top_n most frequent values in codes."""
+        totals = pd.Series(np.bincount(codes[codes >= 0], minlength=n_categories))
+        return totals[totals > 0].sort_values(ascending=False).head(top_n).index.to_numpy()
     
     def get_weekly_posting_rhythm(self, filtered_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -268,36 +521,20 @@ class SocialMediaAnalytics:
             DataFrame with day of week posting patterns
         """
         if filtered_data.empty or filtered_data['created_at'].isna().all():
-            return pd.DataFrame(columns=['day_of_week', 'post_count'])
-        
-        # Create day of week column if it doesn't exist
-        df_copy = filtered_data.copy()
-        df_copy['day_of_week'] = df_copy['created_at'].dt.day_name()
-        
-        # Group by day of week
-        rhythm_data = (df_copy.groupby('day_of_week')
-                      .size()
-                      .reset_index(name='post_count'))
-        
-        # Ensure all days are represented in correct order
-        days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
-        # Create complete data with all days
-        complete_data = []
-        for day in days_order:
-            existing = rhythm_data[rhythm_data['day_of_week'] == day]
-            if not existing.empty:
-                complete_data.append({
-                    'day_of_week': day,
-                    'post_count': existing['post_count'].iloc[0]
-                })
-            else:
-                complete_data.append({
-                    'day_of_week': day,
-                    'post_count': 0
-                })
-        
-        return pd.DataFrame(complete_data)
+            return _EMPTY_RHYTHM.copy()
+        
+        # Count posts per weekday index (Monday=0) so every day is represented in order
+        day_index = filtered_data['created_at'].dropna().dt.dayofweek.to_numpy()
+        post_counts = np.bincount(day_index, minlength=len(DAYS_OF_WEEK))
+        
+        return pd.DataFrame({'day_of_week': DAYS_OF_WEEK, 'post_count': post_counts})
+    
+    def _is_two_type_bipartite(self, graph: nx.Graph) -> bool:
+        """Check whether nodes carry two node_type values and every edge joins different types."""
+        node_types = nx.get_node_attributes(graph, 'node_type')
+        if len(node_types) != graph.number_of_nodes() or len(set(node_types.values())) > 2:
+            return False
+        return all(node_types[u] != node_types[v] for u, v in graph.edges())
     
     def get_network_stats(self, graph: nx.Graph) -> Dict[str, Any]:
         """
@@ -318,18 +555,32 @@ class SocialMediaAnalytics:
                 'connected_components': 0
             }
         
+        num_nodes = graph.number_of_nodes()
+        num_edges = graph.number_of_edges()
+        
         stats = {
-            'nodes': graph.number_of_nodes(),
-            'edges': graph.number_of_edges(),
-            'density': nx.density(graph),
-            'connected_components': nx.number_connected_components(graph)
+            'nodes': num_nodes,
+            'edges': num_edges,
+            'density': num_edges / (num_nodes * (num_nodes - 1)) * 2 if num_nodes > 1 else 0
         }
         
-        # Calculate average clustering coefficient
-        try:
-            stats['avg_clustering'] = nx.average_clustering(graph)
-        except:
-            stats['avg_clustering'] = 0
+        if SCIPY_AVAILABLE:
+            adjacency = nx.to_scipy_sparse_array(graph, weight=None, format='csr')
+            stats['connected_components'] = int(
+                csgraph.connected_components(adjacency, directed=False, return_labels=False)
+            )
+        else:
+            stats['connected_components'] = nx.number_connected_components(graph)
+        
+        # Every edge of a two-type (author/subreddit) graph joins the two types,
+        # so it has no triangles and its clustering coefficient is zero
+        if self._is_two_type_bipartite(graph):
+            stats['avg_clustering'] = 0.0
+        else:
+            try:
+                stats['avg_clustering'] = nx.average_clustering(graph)
+            except:
+                stats['avg_clustering'] = 0
         
         return stats
 
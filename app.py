@@ -3,14 +3,18 @@ Social Media Analytics Dashboard
 A Streamlit application for analyzing social media data with interactive visualizations.
 """
 
+import io
 import streamlit as st
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import plotly.express as px
 from data_loader import load_and_preprocess_data
 from analytics import SocialMediaAnalytics
 from visualizations import SocialMediaVisualizations, create_top_keywords_chart
-from gemini_chatbot import GeminiChatbot, render_chatbot_interface, is_gemini_available
+from gemini_chatbot import (
+    GeminiChatbot, render_chatbot_interface, prefetch_suggested_questions, is_gemini_available
+)
 import networkx as nx
 
 
@@ -59,29 +63,142 @@ def load_data():
         return pd.DataFrame()
 
 
-def apply_filters(data, keyword_filter, date_range, subreddit_filter):
-    """Apply user-selected filters to the data."""
-    filtered_data = data.copy()
+@st.cache_resource
+def get_analytics():
+    """Create the analytics engine once so its per-post caches survive reruns."""
+    return SocialMediaAnalytics(load_data())
+
+
+def get_filter_signature(keyword_filter, date_range, subreddit_filter):
+    """Build a hashable key identifying the current filter selection."""
+    dates = tuple(date_range) if date_range and len(date_range) == 2 else None
+    return (keyword_filter.lower() if keyword_filter else '', dates, subreddit_filter or "All")
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def apply_filters(_data, keyword_filter, date_range, subreddit_filter):
+    """
+    Apply user-selected filters to the data.
+    
+    Results are cached on the filter values only; the dataset is loaded
+    once and never changes, so it is not hashed. The filtered frame is kept
+    as a shared object (cache_resource): cache_data would pickle and unpickle
+    it, up to the whole dataset, on every rerun, which costs more than the
+    mask it saves. Callers only read it.
+    """
+    data = _data
+    
+    # Combine all filters into one boolean mask and select rows once
+    mask = np.ones(len(data), dtype=bool)
     
     # Keyword filter
     if keyword_filter:
-        filtered_data = filtered_data[
-            filtered_data['combined_text'].str.contains(keyword_filter.lower(), na=False)
-        ]
+        mask &= data['combined_text'].str.contains(keyword_filter.lower(), na=False, regex=False).to_numpy()
     
     # Date range filter
     if date_range and len(date_range) == 2:
         start_date, end_date = date_range
-        filtered_data = filtered_data[
-            (filtered_data['created_at'].dt.date >= start_date) &
-            (filtered_data['created_at'].dt.date <= end_date)
-        ]
+        # Compare raw timestamps against [start day, day after end) bounds
+        timestamps = data['created_at'].to_numpy()
+        lower = np.datetime64(start_date, 'D')
+        upper = np.datetime64(end_date, 'D') + np.timedelta64(1, 'D')
+        mask &= (timestamps >= lower) & (timestamps < upper)
     
     # Subreddit filter
     if subreddit_filter and subreddit_filter != "All":
-        filtered_data = filtered_data[filtered_data['subreddit'] == subreddit_filter]
+        mask &= (data['subreddit'] == subreddit_filter).to_numpy()
     
-    return filtered_data
+    return data[mask]
+
+
+# Analytics cached per filter signature so widget changes that do not affect
+# the filters (e.g. the AI assistant panel) skip recomputation.
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_summary_stats(filter_signature, _analytics, _filtered_data):
+    """Cached wrapper around SocialMediaAnalytics.get_summary_stats."""
+    return _analytics.get_summary_stats(_filtered_data)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_time_series(filter_signature, _analytics, _filtered_data, freq='D'):
+    """Cached wrapper around SocialMediaAnalytics.get_time_series_data."""
+    return _analytics.get_time_series_data(_filtered_data, freq=freq)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_weekly_rhythm(filter_signature, _analytics, _filtered_data):
+    """Cached wrapper around SocialMediaAnalytics.get_weekly_posting_rhythm."""
+    return _analytics.get_weekly_posting_rhythm(_filtered_data)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_top_keywords(filter_signature, _analytics, _filtered_data, top_n=10):
+    """Cached wrapper around SocialMediaAnalytics.get_top_keywords."""
+    return _analytics.get_top_keywords(_filtered_data, top_n=top_n)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_author_subreddit_network(filter_signature, _analytics, _filtered_data):
+    """Cached wrapper around SocialMediaAnalytics.build_top_author_subreddit_network."""
+    return _analytics.build_top_author_subreddit_network(_filtered_data)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_keyword_trends(filter_signature, _analytics, _filtered_data, keywords, freq='D'):
+    """Cached wrapper around SocialMediaAnalytics.get_keyword_time_series."""
+    return _analytics.get_keyword_time_series(_filtered_data, list(keywords), freq=freq)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_top_contributors(filter_signature, _analytics, _filtered_data, top_n=10):
+    """Cached wrapper around SocialMediaAnalytics.get_top_contributors."""
+    return _analytics.get_top_contributors(_filtered_data, top_n=top_n)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compute_network_stats(filter_signature, _analytics, _network_graph):
+    """Cached wrapper around SocialMediaAnalytics.get_network_stats."""
+    return _analytics.get_network_stats(_network_graph)
+
+
+# Figures are cached on the same filter signature as the data they plot, so a
+# rerun with an already seen filter state skips rebuilding them. They are kept
+# as shared objects (cache_resource) because cache_data would unpickle, and so
+# re-validate, every figure on every rerun; the figures are never modified.
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_time_series_figure(filter_signature, _viz, _time_series_data):
+    """Cached wrapper around SocialMediaVisualizations.create_time_series_plot."""
+    return _viz.create_time_series_plot(_time_series_data)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_weekly_rhythm_figure(filter_signature, _viz, _rhythm_data):
+    """Cached wrapper around SocialMediaVisualizations.create_weekly_rhythm_bar_chart."""
+    return _viz.create_weekly_rhythm_bar_chart(_rhythm_data)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_top_keywords_figure(filter_signature, _top_keywords, title="Top Keywords"):
+    """Cached wrapper around create_top_keywords_chart."""
+    return create_top_keywords_chart(_top_keywords, title)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_keyword_trends_figure(filter_signature, _viz, _keyword_trends, keywords):
+    """Cached wrapper around SocialMediaVisualizations.create_keyword_trends_plot."""
+    return _viz.create_keyword_trends_plot(_keyword_trends)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_contributors_figure(filter_signature, _viz, _top_contributors, chart_type="bar"):
+    """Cached wrapper around SocialMediaVisualizations.create_contributors_chart."""
+    return _viz.create_contributors_chart(_top_contributors, chart_type=chart_type)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def build_network_html(filter_signature, _viz, _network_graph, title="Author Network"):
+    """Cached wrapper around SocialMediaVisualizations.create_network_visualization."""
+    return _viz.create_network_visualization(_network_graph, title)
 
 
 def main():
@@ -105,9 +222,12 @@ def main():
         return
     
     # Initialize analytics and visualization classes
-    analytics = SocialMediaAnalytics(data)
+    analytics = get_analytics()
     viz = SocialMediaVisualizations()
     
+    # Filter the analytics copy so its categorical columns carry through
+    data = analytics.data
+    
     # Initialize chatbot
     if "chatbot" not in st.session_state:
         st.session_state.chatbot = GeminiChatbot()
@@ -142,7 +262,8 @@ def main():
     subreddit_filter = st.sidebar.selectbox("Subreddit:", subreddit_options)
     
     # Apply filters
-    filtered_data = apply_filters(data, keyword_filter, date_range, subreddit_filter)
+    filter_signature = get_filter_signature(keyword_filter, date_range, subreddit_filter)
+    filtered_data = apply_filters(data, *filter_signature)
     
     # Display filter results
     st.sidebar.markdown("---")
@@ -156,9 +277,24 @@ def main():
     # Summary Statistics
     st.markdown('<h2 class="section-header">📈 Summary Statistics</h2>', unsafe_allow_html=True)
     
-    summary_stats = analytics.get_summary_stats(filtered_data)
+    summary_stats = compute_summary_stats(filter_signature, analytics, filtered_data)
     viz.create_summary_metrics_cards(summary_stats)
     
+    # Compute everything the AI sidebar summarises up front, so its suggested
+    # questions load while the charts below render, whatever the network holds
+    top_keywords = compute_top_keywords(filter_signature, analytics, filtered_data, top_n=15)
+    top_contributors = compute_top_contributors(filter_signature, analytics, filtered_data, top_n=10)
+    with st.spinner("Building top authors-subreddits network..."):
+        network_graph = compute_author_subreddit_network(filter_signature, analytics, filtered_data)
+    network_stats = {}
+    if network_graph.number_of_nodes() > 0:
+        network_stats = compute_network_stats(filter_signature, analytics, network_graph)
+    
+    if is_gemini_available():
+        prefetch_suggested_questions(
+            st.session_state.chatbot, summary_stats, top_keywords, top_contributors, network_stats
+        )
+    
     # Time Series Analysis
     st.markdown('<h2 class="section-header">📅 Time Series Analysis</h2>', unsafe_allow_html=True)
     
@@ -166,14 +302,14 @@ def main():
     
     with col1:
         # Post volume over time
-        time_series_data = analytics.get_time_series_data(filtered_data, freq='D')
-        time_series_fig = viz.create_time_series_plot(time_series_data)
+        time_series_data = compute_time_series(filter_signature, analytics, filtered_data, freq='D')
+        time_series_fig = build_time_series_figure(filter_signature, viz, time_series_data)
         st.plotly_chart(time_series_fig, use_container_width=True)
     
     with col2:
         # Weekly posting rhythm bar chart
-        rhythm_data = analytics.get_weekly_posting_rhythm(filtered_data)
-        rhythm_fig = viz.create_weekly_rhythm_bar_chart(rhythm_data)
+        rhythm_data = compute_weekly_rhythm(filter_signature, analytics, filtered_data)
+        rhythm_fig = build_weekly_rhythm_figure(filter_signature, viz, rhythm_data)
         st.plotly_chart(rhythm_fig, use_container_width=True)
     
     # Topic/Theme Analysis
@@ -183,8 +319,7 @@ def main():
     
     with col1:
         # Top keywords
-        top_keywords = analytics.get_top_keywords(filtered_data, top_n=15)
-        keywords_fig = create_top_keywords_chart(top_keywords, "Top Keywords")
+        keywords_fig = build_top_keywords_figure(filter_signature, top_keywords, "Top Keywords")
         st.plotly_chart(keywords_fig, use_container_width=True)
         
     
@@ -192,11 +327,13 @@ def main():
         # Keyword trends over time
         if top_keywords:
             # Use top 5 keywords for trend analysis
-            top_5_keywords = [kw[0] for kw in top_keywords[:5]]
-            keyword_trends = analytics.get_keyword_time_series(filtered_data, top_5_keywords, freq='D')
+            top_5_keywords = tuple(kw[0] for kw in top_keywords[:5])
+            keyword_trends = compute_keyword_trends(
+                filter_signature, analytics, filtered_data, top_5_keywords, freq='D'
+            )
             
             if not keyword_trends.empty:
-                trends_fig = viz.create_keyword_trends_plot(keyword_trends)
+                trends_fig = build_keyword_trends_figure(filter_signature, viz, keyword_trends, top_5_keywords)
                 st.plotly_chart(trends_fig, use_container_width=True)
             else:
                 st.info("No keyword trend data available for the selected period.")
@@ -205,8 +342,7 @@ def main():
     st.markdown('<h2 class="section-header">👥 Community & Contributors</h2>', unsafe_allow_html=True)
     
     # Top contributors (full width)
-    top_contributors = analytics.get_top_contributors(filtered_data, top_n=10)
-    contributors_fig = viz.create_contributors_chart(top_contributors, chart_type="bar")
+    contributors_fig = build_contributors_figure(filter_signature, viz, top_contributors, chart_type="bar")
     st.plotly_chart(contributors_fig, use_container_width=True)
     
     # Network Analysis
@@ -215,17 +351,11 @@ def main():
     st.markdown("**Network showing connections between the most active authors and popular subreddits:**")
     st.info("📊 **Automatically displays:** Top 15 authors and top 10 subreddits based on post volume")
     
-    # Build and display network
-    with st.spinner("Building top authors-subreddits network..."):
-        network_graph = analytics.build_top_author_subreddit_network(filtered_data)
-    
+    # Display the network built above
     if network_graph.number_of_nodes() > 0:
-        # Network statistics
-        network_stats = analytics.get_network_stats(network_graph)
-        
         # Network visualization
         st.markdown("**Interactive Author-Subreddit Network:**")
-        network_html = viz.create_network_visualization(network_graph, "Author-Subreddit Network")
+        network_html = build_network_html(filter_signature, viz, network_graph, "Author-Subreddit Network")
         
         # Display network in Streamlit
         st.components.v1.html(network_html, height=500)
@@ -250,10 +380,13 @@ def main():
     
     with col1:
         if st.button("📊 Download Filtered Data (CSV)"):
-            csv_data = filtered_data.to_csv(index=False)
+            # Write the CSV bytes straight into a buffer instead of building one big string
+            csv_buffer = io.BytesIO()
+            filtered_data.to_csv(csv_buffer, index=False, encoding='utf-8')
+            csv_buffer.seek(0)
             st.download_button(
                 label="Download CSV",
-                data=csv_data,
+                data=csv_buffer,
                 file_name=f"social_media_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv"
             )
@@ -300,7 +433,7 @@ NETWORK STATISTICS:
             summary_stats,
             top_keywords,
             top_contributors,
-            network_stats if 'network_stats' in locals() else {}
+            network_stats
         )
 
 
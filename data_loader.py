@@ -3,20 +3,72 @@ Data loading and preprocessing module for social media analytics dashboard.
 Handles JSONL ingestion, cleaning, and normalization.
 """
 
+import glob
 import json
+import mmap
+import os
 import pandas as pd
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import re
-from urllib.parse import urlparse
+import tempfile
+from collections import Counter
+from itertools import chain
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from joblib import Parallel, delayed
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401 - enables the Arrow-backed string dtype
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 
 class SocialMediaDataLoader:
     """Handles loading and preprocessing of social media data from JSONL files."""
     
+    # Precompiled extraction patterns, applied to the lowercased combined text
+    HASHTAG_PATTERN = re.compile(r'#(\w+)')
+    MENTION_PATTERN = re.compile(r'u/(\w+)')
+    # Host part of a URL, matching urlsplit's netloc for scheme and scheme-relative URLs
+    DOMAIN_PATTERN = re.compile(r'^(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#]*)')
+    
+    # Low-cardinality columns stored as categoricals (integer codes plus a small dictionary)
+    CATEGORICAL_COLUMNS = ('author', 'subreddit', 'platform')
+    # High-cardinality text columns stored in contiguous Arrow buffers when pyarrow is available
+    STRING_COLUMNS = ('id', 'title', 'text', 'url')
+    # Per-post tuples of extracted hashtags, domains and mentions
+    LIST_COLUMNS = ('hashtags', 'domains', 'mentions')
+    DAYS_OF_WEEK = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+    
+    # Files at least this large are parsed in parallel byte ranges; for smaller
+    # files, worker start-up costs more than the parsing it would save
+    PARALLEL_LOAD_MIN_BYTES = 64 * 1024 * 1024
+    
+    # Column order of the tuples returned by _extract_post_fields
+    POST_FIELDS = ('id', 'title', 'text', 'author', 'platform', 'subreddit',
+                   'score', 'num_comments', 'url', 'created_at')
+    
     def __init__(self):
         self.data = None
         self.processed_data = None
+        # One simdjson parser is reused for every line so its buffers are allocated once
+        self._json_parser = simdjson.Parser() if SIMDJSON_AVAILABLE else None
     
     def load_jsonl(self, file_path: str) -> pd.DataFrame:
         """
@@ -28,134 +80,267 @@ class SocialMediaDataLoader:
         Returns:
             DataFrame with loaded and cleaned data
         """
-        posts = []
-        
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                for line_num, line in enumerate(file, 1):
-                    try:
-                        # Parse JSON line
-                        post_data = json.loads(line.strip())
-                        
-                        # Extract Reddit post data from nested structure
-                        if 'data' in post_data:
-                            post = post_data['data']
-                        else:
-                            post = post_data
-                        
-                        # Extract relevant fields with safe handling
-                        processed_post = self._extract_post_fields(post)
-                        if processed_post:
-                            posts.append(processed_post)
-                            
-                    except json.JSONDecodeError as e:
-                        print(f"Warning: Skipping malformed JSON on line {line_num}: {e}")
-                        continue
-                    except Exception as e:
-                        print(f"Warning: Error processing line {line_num}: {e}")
-                        continue
+            with open(file_path, 'rb') as file:
+                file_size = os.fstat(file.fileno()).st_size
+                if JOBLIB_AVAILABLE and file_size >= self.PARALLEL_LOAD_MIN_BYTES:
+                    posts, skipped = self._load_parallel(file_path, file)
+                else:
+                    posts, skipped = self._parse_lines(self._iter_lines(file))
         
         except FileNotFoundError:
             raise FileNotFoundError(f"Data file not found: {file_path}")
         
-        # Convert to DataFrame
-        df = pd.DataFrame(posts)
+        # One summary line per kind of problem instead of a print per bad line
+        if skipped['malformed']:
+            print(f"Warning: Skipped {skipped['malformed']} malformed JSON lines")
+        if skipped['error']:
+            print(f"Warning: Skipped {skipped['error']} lines that could not be processed")
+        
+        # Transpose the row tuples into columns and build the DataFrame from those
+        columns = list(zip(*posts)) or [()] * len(self.POST_FIELDS)
+        df = pd.DataFrame(dict(zip(self.POST_FIELDS, map(list, columns))))
         
-        # Remove duplicates by ID
-        if 'id' in df.columns:
-            df = df.drop_duplicates(subset=['id'], keep='first')
+        # Arrow strings avoid a Python object per cell and run .str ops as C kernels
+        if PYARROW_AVAILABLE:
+            df = df.astype({column: 'string[pyarrow]' for column in self.STRING_COLUMNS})
+        
+        # Convert Unix timestamps to datetimes in one vectorized pass
+        if 'created_at' in df.columns:
+            df['created_at'] = self._to_datetime(df['created_at'])
         
         print(f"Loaded {len(df)} unique posts from {file_path}")
         return df
     
-    def _extract_post_fields(self, post: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _load_parallel(self, file_path: str, file) -> Tuple[List[Tuple[Any, ...]], Counter]:
         """
-        Extract and normalize fields from a social media post.
+        Parse a large JSONL file in newline-aligned byte ranges across worker processes.
         
         Args:
-            post: Raw post data dictionary
+            file_path: Path to the JSONL file, reopened by each worker
+            file: The same file, opened in binary mode
             
         Returns:
-            Dictionary with normalized fields or None if invalid
+            Post tuples in file order and the counts of skipped lines by reason
         """
-        try:
-            # Core fields
-            extracted = {
-                'id': post.get('id', ''),
-                'title': post.get('title', ''),
-                'text': post.get('selftext', ''),  # Reddit uses 'selftext'
-                'author': post.get('author', 'unknown'),
-                'platform': 'reddit',  # Since this is Reddit data
-                'subreddit': post.get('subreddit', ''),
-                'score': post.get('score', 0),
-                'num_comments': post.get('num_comments', 0),
-                'url': post.get('url', ''),
-            }
+        n_chunks = os.cpu_count() or 1
+        
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Move each evenly spaced split point forward to the start of the next line
+            bounds = [0]
+            for chunk in range(1, n_chunks):
+                split = mapped.find(b'\n', max(bounds[-1], len(mapped) * chunk // n_chunks))
+                if split == -1:
+                    break
+                if split + 1 > bounds[-1]:
+                    bounds.append(split + 1)
+            bounds.append(len(mapped))
+            
+            # Line number of each range's first line, so warnings still point at the file
+            first_line_nums = [1]
+            for start, end in zip(bounds[:-1], bounds[1:-1]):
+                first_line_nums.append(first_line_nums[-1] + mapped[start:end].count(b'\n'))
+        
+        chunk_results = Parallel(n_jobs=-1)(
+            delayed(_load_jsonl_range)(file_path, start, end, first_line_num)
+            for start, end, first_line_num in zip(bounds[:-1], bounds[1:], first_line_nums)
+        )
+        
+        skipped = Counter()
+        for _, chunk_skipped in chunk_results:
+            skipped.update(chunk_skipped)
+        
+        # Each worker only skips repeats within its own range; keep the first
+        # occurrence of ids that repeat across ranges as well
+        posts = []
+        seen_ids = set()
+        for post in chain.from_iterable(chunk_posts for chunk_posts, _ in chunk_results):
+            if post[0] not in seen_ids:
+                seen_ids.add(post[0])
+                posts.append(post)
+        
+        return posts, skipped
+    
+    def _parse_lines(self, lines: Iterator[bytes], first_line_num: int = 1) -> Tuple[List[Tuple[Any, ...]], Counter]:
+        """
+        Parse JSONL lines into post tuples, skipping lines that cannot be parsed
+        and posts whose id was already seen.
+        
+        Only the first problem of each kind is printed in full; the rest are
+        counted so that a badly broken file does not flood the console.
+        
+        Args:
+            lines: Raw JSONL lines
+            first_line_num: File line number of the first line, for warnings
             
-            # Handle timestamp - Reddit uses created_utc
-            timestamp = post.get('created_utc', post.get('created', None))
-            if timestamp:
-                try:
-                    # Convert Unix timestamp to datetime
-                    extracted['created_at'] = datetime.fromtimestamp(float(timestamp))
-                except (ValueError, TypeError):
-                    extracted['created_at'] = None
-            else:
-                extracted['created_at'] = None
+        Returns:
+            Post tuples in line order and the counts of skipped lines by reason
+        """
+        posts = []
+        seen_ids = set()
+        skipped = Counter()
+        
+        # simdjson parses lazily, so untouched fields (media, previews, ...) are
+        # never turned into Python objects; orjson and the stdlib accept bytes too
+        if self._json_parser is not None:
+            loads = self._json_parser.parse
+        elif ORJSON_AVAILABLE:
+            loads = orjson.loads
+        else:
+            loads = json.loads
+        
+        for line_num, line in enumerate(lines, first_line_num):
+            try:
+                processed_post = self._parse_post_line(line, loads, seen_ids)
+                if processed_post:
+                    posts.append(processed_post)
             
-            # Extract hashtags from title and text
-            extracted['hashtags'] = self._extract_hashtags(
-                extracted['title'] + ' ' + extracted['text']
-            )
+            # json, orjson and simdjson decode errors are all ValueErrors
+            except ValueError as e:
+                if not skipped['malformed']:
+                    print(f"Warning: Skipping malformed JSON on line {line_num}: {e}")
+                skipped['malformed'] += 1
+                continue
+            except Exception as e:
+                if not skipped['error']:
+                    print(f"Warning: Error processing line {line_num}: {e}")
+                skipped['error'] += 1
+                continue
+        
+        return posts, skipped
+    
+    def _iter_lines(self, file, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Yield the lines of an open binary file through a read-only memory map.
+        
+        pysimdjson has no batched (parse_many) API, so batching is done at the
+        I/O level instead: mmap.readline slices lines straight out of the
+        mapped file, which is several times faster than buffered line iteration.
+        
+        Args:
+            file: File opened in binary mode
+            start: Byte offset of the first line to yield
+            end: Byte offset to stop at, or None for the end of the file
+        """
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if start == 0 and end is None:
+                yield from iter(mapped.readline, b'')
+                return
             
-            # Extract domains from URLs
-            extracted['domains'] = self._extract_domains([extracted['url']])
+            mapped.seek(start)
+            stop = len(mapped) if end is None else end
+            while mapped.tell() < stop:
+                yield mapped.readline()
+    
+    def _parse_post_line(self, line: bytes, loads, seen_ids: set) -> Optional[Tuple[Any, ...]]:
+        """
+        Parse a single JSONL line and extract its post fields.
+        
+        Kept separate from the read loop so the lazy simdjson document goes
+        out of scope before the shared parser reads the next line.
+        
+        Args:
+            line: Raw JSONL line
+            loads: JSON parsing function to use
+            seen_ids: Ids of the posts extracted so far; updated in place
             
-            # Extract mentions (Reddit uses u/username format)
-            extracted['mentions'] = self._extract_mentions(
-                extracted['title'] + ' ' + extracted['text']
+        Returns:
+            Tuple of normalized fields in POST_FIELDS order, or None if invalid
+            or a duplicate
+        """
+        # Parse JSON line
+        post_data = loads(line)
+        
+        # Extract Reddit post data from nested structure
+        if 'data' in post_data:
+            post = post_data['data']
+        else:
+            post = post_data
+        
+        # Skip duplicates before paying for field extraction
+        if post.get('id', '') in seen_ids:
+            return None
+        
+        # Extract relevant fields with safe handling
+        extracted = self._extract_post_fields(post)
+        
+        if extracted and self._json_parser is not None:
+            # Materialize any nested values before the parser buffer is reused
+            extracted = tuple(
+                value.as_dict() if isinstance(value, simdjson.Object)
+                else value.as_list() if isinstance(value, simdjson.Array)
+                else value
+                for value in extracted
             )
+        
+        if extracted:
+            seen_ids.add(extracted[0])
+        
+        return extracted
+    
+    def _extract_post_fields(self, post: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+        """
+        Extract and normalize fields from a social media post.
+        
+        Args:
+            post: Raw post data dictionary
             
-            return extracted
+        Returns:
+            Tuple of normalized fields in POST_FIELDS order or None if invalid
+        """
+        try:
+            get = post.get
             
-        except Exception as e:
+            # Core fields, in POST_FIELDS order
+            return (
+                get('id', ''),
+                get('title', ''),
+                get('selftext', ''),  # Reddit uses 'selftext'
+                get('author', 'unknown'),
+                'reddit',  # Since this is Reddit data
+                get('subreddit', ''),
+                get('score', 0),
+                get('num_comments', 0),
+                get('url', ''),
+                # Handle timestamp - Reddit uses created_utc; the raw Unix value
+                # is converted for the whole column at once in load_jsonl
+                get('created_utc', get('created', None)),
+            )
+            
+        # Only a post that is not a JSON object can fail here
+        except (AttributeError, TypeError) as e:
             print(f"Warning: Error extracting fields from post: {e}")
             return None
     
-    def _extract_hashtags(self, text: str) -> List[str]:
-        """Extract hashtags from text."""
-        if not text:
-            return []
-        
-        # Find hashtags (# followed by word characters)
-        hashtags = re.findall(r'#(\w+)', text.lower())
-        return list(set(hashtags))  # Remove duplicates
-    
-    def _extract_domains(self, urls: List[str]) -> List[str]:
-        """Extract domains from list of URLs."""
-        domains = []
-        for url in urls:
-            if url and isinstance(url, str):
-                try:
-                    parsed = urlparse(url)
-                    if parsed.netloc:
-                        # Remove www. prefix for consistency
-                        domain = parsed.netloc.lower()
-                        if domain.startswith('www.'):
-                            domain = domain[4:]
-                        domains.append(domain)
-                except Exception:
-                    continue
-        return list(set(domains))
-    
-    def _extract_mentions(self, text: str) -> List[str]:
-        """Extract user mentions from text (Reddit format: u/username)."""
-        if not text:
-            return []
-        
-        # Find Reddit-style mentions
-        mentions = re.findall(r'u/(\w+)', text.lower())
-        return list(set(mentions))
+    def _to_datetime(self, timestamps: pd.Series) -> pd.Series:
+        """
+        Convert raw Unix timestamps to naive UTC datetimes.
+        
+        Missing, zero and unparseable timestamps become NaT, so they are
+        dropped along with other invalid timestamps in preprocess_data.
+        
+        Args:
+            timestamps: Raw created_utc values
+            
+        Returns:
+            datetime64 Series
+        """
+        seconds = pd.to_numeric(timestamps, errors='coerce')
+        return pd.to_datetime(seconds.where(seconds != 0), unit='s', errors='coerce')
+    
+    def _find_unique(self, texts: pd.Series, pattern: re.Pattern) -> List[Tuple[str, ...]]:
+        """Find the distinct matches of pattern in each text, in first-seen order."""
+        return [tuple(dict.fromkeys(matches)) for matches in texts.str.findall(pattern)]
+    
+    def _extract_domains(self, urls: pd.Series) -> List[Tuple[str, ...]]:
+        """Extract the host of each URL, lowercased and without a www. prefix."""
+        hosts = (urls.str.extract(self.DOMAIN_PATTERN, expand=False)
+                 .str.lower()
+                 .str.removeprefix('www.'))
+        return [(host,) if isinstance(host, str) and host else () for host in hosts]
     
     def preprocess_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -167,51 +352,147 @@ class SocialMediaDataLoader:
         Returns:
             Preprocessed DataFrame
         """
-        # Create a copy to avoid modifying original
-        processed_df = df.copy()
-        
-        # Filter out posts without valid timestamps
-        processed_df = processed_df.dropna(subset=['created_at'])
-        
-        # Add derived fields
-        processed_df['date'] = processed_df['created_at'].dt.date
-        processed_df['hour'] = processed_df['created_at'].dt.hour
-        processed_df['day_of_week'] = processed_df['created_at'].dt.day_name()
+        # Filter out posts without valid timestamps; dropna returns a new frame
+        # (sharing column data under copy-on-write), so no upfront copy is needed
+        processed_df = df.dropna(subset=['created_at'])
         
-        # Create combined text field for searching
-        processed_df['combined_text'] = (
+        # Create combined text field for searching, built once and shared by the
+        # hashtag and mention extraction below
+        combined_text = (
             processed_df['title'].fillna('') + ' ' + 
             processed_df['text'].fillna('')
         ).str.lower()
         
-        # Convert list fields to string representation for display
-        processed_df['hashtags_str'] = processed_df['hashtags'].apply(
-            lambda x: ', '.join(x) if x else ''
-        )
-        processed_df['domains_str'] = processed_df['domains'].apply(
-            lambda x: ', '.join(x) if x else ''
-        )
-        processed_df['mentions_str'] = processed_df['mentions'].apply(
-            lambda x: ', '.join(x) if x else ''
+        # Extract hashtags, domains and mentions column-wise rather than per post
+        processed_df['hashtags'] = self._find_unique(combined_text, self.HASHTAG_PATTERN)
+        processed_df['domains'] = self._extract_domains(processed_df['url'])
+        processed_df['mentions'] = self._find_unique(combined_text, self.MENTION_PATTERN)
+        
+        # Add derived fields from one pass over the raw epoch seconds; the date
+        # stays datetime64 instead of boxing a Python date object per row
+        created_at = processed_df['created_at'].to_numpy()
+        seconds = created_at.astype('datetime64[s]').view('int64')
+        days = seconds // 86400
+        processed_df['date'] = created_at.astype('datetime64[D]')
+        processed_df['hour'] = ((seconds // 3600) % 24).astype('int32')
+        # 1970-01-01 was a Thursday, index 3 in the Monday-first DAYS_OF_WEEK
+        processed_df['day_of_week'] = pd.Categorical.from_codes(
+            (days + 3) % 7, categories=self.DAYS_OF_WEEK
         )
         
+        for column in self.CATEGORICAL_COLUMNS:
+            processed_df[column] = processed_df[column].astype('category')
+        
+        # Arrow-backed strings let substring searches run as vectorized kernels;
+        # title and text are already Arrow strings, so this is normally a no-op
+        if PYARROW_AVAILABLE:
+            combined_text = combined_text.astype('string[pyarrow]')
+        
+        processed_df['combined_text'] = combined_text
+        
+        # Convert list fields to string representation for display
+        for column in self.LIST_COLUMNS:
+            processed_df[f'{column}_str'] = processed_df[column].str.join(', ')
+        
         print(f"Preprocessed {len(processed_df)} posts")
         return processed_df
 
 
-def load_and_preprocess_data(file_path: str = "data/data.jsonl") -> pd.DataFrame:
+def _load_jsonl_range(file_path: str, start: int, end: int, first_line_num: int) -> Tuple[List[Tuple[Any, ...]], Counter]:
+    """Parse the lines in one byte range of a JSONL file; runs in a worker process."""
+    loader = SocialMediaDataLoader()
+    with open(file_path, 'rb') as file:
+        return loader._parse_lines(loader._iter_lines(file, start, end), first_line_num)
+
+
+# Version of the preprocessed output stored in the Parquet cache. Bump it whenever
+# preprocess_data changes its columns or values, so older caches are rebuilt
+CACHE_VERSION = 2
+
+
+def _get_cache_path(file_path: str) -> str:
+    """Parquet cache path for a JSONL file, keyed by cache version and the file's size and modification time."""
+    stat = os.stat(file_path)
+    return f"{file_path}.v{CACHE_VERSION}-{stat.st_size}-{stat.st_mtime_ns}.parquet"
+
+
+def _read_cache(cache_path: str) -> pd.DataFrame:
+    """Read a preprocessed DataFrame back from its Parquet cache."""
+    df = pd.read_parquet(cache_path)
+    
+    # Restore the dtypes preprocess_data produces: Parquet returns list columns as
+    # NumPy arrays, datetimes in milliseconds and joined strings as str
+    for column in SocialMediaDataLoader.LIST_COLUMNS:
+        df[column] = [tuple(values) for values in df[column]]
+        df[f'{column}_str'] = df[f'{column}_str'].astype(object)
+    for column in ('created_at', 'date'):
+        df[column] = df[column].astype('datetime64[s]')
+    
+    print(f"Loaded {len(df)} preprocessed posts from cache {cache_path}")
+    return df
+
+
+def _write_cache(df: pd.DataFrame, file_path: str, cache_path: str) -> None:
+    """Write a preprocessed DataFrame to its Parquet cache, replacing stale caches."""
+    temp_path = None
+    try:
+        for stale_path in glob.glob(f"{glob.escape(file_path)}.*.parquet"):
+            os.remove(stale_path)
+        
+        # Write to a temporary file and rename it, so a crash or another session
+        # never sees a partly written file under a valid cache name
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(cache_path)),
+                                         suffix='.tmp', delete=False) as f:
+            temp_path = f.name
+        df.to_parquet(temp_path, compression='zstd')
+        os.replace(temp_path, cache_path)
+    except (OSError, ValueError) as e:
+        # Caching is best effort; a read-only data directory just means no speedup
+        print(f"Warning: Could not write data cache {cache_path}: {e}")
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def load_and_preprocess_data(file_path: str = "data/data.jsonl", use_cache: bool = True) -> pd.DataFrame:
     """
     Convenience function to load and preprocess data in one step.
     
+    When pyarrow is available the result is cached as Parquet next to the
+    source file, and later calls read the cache until the source changes.
+    
     Args:
         file_path: Path to the JSONL data file
+        use_cache: Whether to read and write the Parquet cache
         
     Returns:
         Preprocessed DataFrame ready for analysis
     """
+    cache_path = None
+    if use_cache and PYARROW_AVAILABLE:
+        try:
+            cache_path = _get_cache_path(file_path)
+        except OSError:
+            pass  # A missing source file is reported by load_jsonl
+    
+    if cache_path and os.path.exists(cache_path):
+        try:
+            return _read_cache(cache_path)
+        except (OSError, ValueError, KeyError) as e:
+            # pyarrow.ArrowInvalid is a ValueError. A corrupt cache is removed and
+            # rebuilt, rather than failing every load until it is deleted by hand
+            print(f"Warning: Discarding unreadable data cache {cache_path}: {e}")
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
+    
     loader = SocialMediaDataLoader()
     raw_data = loader.load_jsonl(file_path)
     processed_data = loader.preprocess_data(raw_data)
+    
+    if cache_path:
+        _write_cache(processed_data, file_path, cache_path)
+    
     return processed_data
 
 
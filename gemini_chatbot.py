@@ -1,39 +1,162 @@
 """
 Gemini AI Chatbot for Social Media Analytics Dashboard
 Provides AI-powered insights and answers questions about the data.
-Redesigned with floating button and sidebar panel interface.
+Redesigned with a toggle button and sidebar panel interface.
 """
 
 import streamlit as st
 import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+import hashlib
+import importlib.util
 import json
 import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
 
-try:
-    from dotenv import load_dotenv
-    DOTENV_AVAILABLE = True
-except ImportError:
-    DOTENV_AVAILABLE = False
+def _module_available(name: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+
+# google.generativeai pulls in grpc and protobuf, so it is only imported once
+# the chatbot is actually initialized; availability is checked without importing
+GEMINI_AVAILABLE = _module_available('google.generativeai')
+DOTENV_AVAILABLE = _module_available('dotenv')
+_genai = None
+
+
+def _load_genai():
+    """Import google.generativeai on first use; returns None if it cannot be imported."""
+    global _genai
+    if _genai is None:
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            return None
+        _genai = genai
+    return _genai
+
+
+# Runs of blank or whitespace-only lines in a data summary
+BLANK_LINES_PATTERN = re.compile(r'\n\s*\n')
+
+
+def _timeout_errors() -> Tuple[type, ...]:
+    """Exception types raised when a Gemini request exceeds its timeout."""
+    try:
+        from google.api_core.exceptions import DeadlineExceeded
+    except ImportError:
+        return (TimeoutError,)
+    return (TimeoutError, DeadlineExceeded)
+
+
+def _minify_context(data_context: str) -> str:
+    """Collapse blank lines and surrounding whitespace in a data summary before sending it."""
+    return BLANK_LINES_PATTERN.sub("\n", data_context).strip()
+
+
+def _context_block(data_context: str) -> str:
+    """Minified [CONTEXT UPDATE] block carrying a data summary."""
+    return f"[CONTEXT UPDATE]\n{_minify_context(data_context)}\n\n"
+
+
+# Answers to prompts built only from the data summary (suggested questions and the
+# quick-question batch) are cached on disk by a hash of their prompt inputs, so
+# unchanged data skips the API round-trip, even across restarts. Chat answers hold
+# what users typed, so they are only cached in memory for their own session
+RESPONSE_CACHE_PATH = ".gemini_cache.json"
+RESPONSE_CACHE_MAX_ENTRIES = 256
+# Every browser session shares the cache file, so writes merge under this lock
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Suggested questions, then the answers to the quick ones, are fetched on background
+# threads while the rest of the page renders. The sidebar never waits for them: it
+# shows the fallback questions and re-checks the suggestions this often until they arrive
+_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+SUGGESTION_POLL_SECONDS = 1
+
+# Only the latest exchanges are kept in the session's chat history
+CHAT_HISTORY_MAX_ENTRIES = 20
+
+# Suggested questions when Gemini is not set up or fails to suggest any
+_FALLBACK_QUESTIONS = (
+    "What patterns can you see in the posting times?",
+    "Who are the most influential contributors?",
+    "What topics are trending in this dataset?",
+    "Are there any signs of coordinated activity?",
+    "What investigation strategies would you recommend?",
+)
+
+
+def _content_hash(*parts: str) -> str:
+    """Short digest of the given strings, used as a cache key."""
+    return hashlib.blake2b("||".join(parts).encode(), digest_size=16).hexdigest()
 
 
 class GeminiChatbot:
     """AI chatbot powered by Google Gemini for social media analytics insights."""
     
+    # System instruction for the AI assistant, shared by every initialized model
+    SYSTEM_INSTRUCTION = """
+You are an AI assistant specialized in social media analytics and investigative journalism. You help users analyze social media data, identify patterns, and generate insights.
+
+Your capabilities include:
+- Analyzing social media trends and patterns
+- Explaining data visualizations and statistics
+- Identifying potential coordination or amplification patterns
+- Suggesting investigation strategies
+- Interpreting network analysis results
+- Providing context about social media behavior
+
+Guidelines:
+- Be helpful, accurate, and professional
+- Focus on factual analysis rather than speculation
+- Suggest actionable insights for investigation
+- Explain technical concepts in accessible language
+- Always consider ethical implications of social media analysis
+- Respect privacy and avoid identifying specific individuals unless they are public figures
+- Provide balanced perspectives on controversial topics
+
+When analyzing data, consider:
+- Temporal patterns (when activity occurs)
+- Network structures (who connects to whom)
+- Content themes and keywords
+- Engagement patterns
+- Potential coordination indicators
+
+The data context is provided incrementally: a message starting with [CONTEXT UPDATE] carries a summary of the social media posts left after the user's filters, and it stays current until the next update. Questions follow [Q]. Provide insights, analysis, or suggestions based on the latest data context and the user's question.
+"""
+    
+    # One tagged answer in the batched response to the sidebar's quick questions
+    ANSWER_PATTERN = re.compile(r'<ANSWER (\d+)>(.*?)</ANSWER>', re.DOTALL)
+    
     def __init__(self):
         self.model = None
         self.chat_session = None
         self.initialized = False
+        # Seconds before a one-off Gemini request is abandoned and retried once;
+        # streamed chat answers have no deadline, as it would cut long answers short
+        self.request_timeout = float(os.getenv("GEMINI_TIMEOUT", "15"))
+        # Hash of the data context the chat session last received
+        self._sent_context_hash = None
+        # Digest of the exchanges so far in this conversation, part of every chat cache key
+        self._conversation_digest = ""
+        self._response_cache = self._load_response_cache()
+        # This session's chat answers, least recently used first
+        self._chat_cache: "OrderedDict[str, str]" = OrderedDict()
         
         # Load environment variables
         if DOTENV_AVAILABLE:
+            from dotenv import load_dotenv
             load_dotenv()
         
         # Try to auto-initialize with environment variable
@@ -61,7 +184,8 @@ class GeminiChatbot:
         Returns:
             True if initialization successful, False otherwise
         """
-        if not GEMINI_AVAILABLE:
+        genai = _load_genai() if GEMINI_AVAILABLE else None
+        if genai is None:
             return False
             
         try:
@@ -86,10 +210,10 @@ class GeminiChatbot:
                 model_name="gemini-2.5-flash",
                 generation_config=generation_config,
                 safety_settings=safety_settings,
-                system_instruction=self._get_system_instruction()
+                system_instruction=self.SYSTEM_INSTRUCTION
             )
             
-            self.chat_session = self.model.start_chat(history=[])
+            self._start_conversation()
             self.initialized = True
             return True
             
@@ -97,36 +221,6 @@ class GeminiChatbot:
             st.error(f"Failed to initialize Gemini: {str(e)}")
             return False
     
-    def _get_system_instruction(self) -> str:
-        """Get the system instruction for the AI assistant."""
-        return """
-You are an AI assistant specialized in social media analytics and investigative journalism. You help users analyze social media data, identify patterns, and generate insights.
-
-Your capabilities include:
-- Analyzing social media trends and patterns
-- Explaining data visualizations and statistics
-- Identifying potential coordination or amplification patterns
-- Suggesting investigation strategies
-- Interpreting network analysis results
-- Providing context about social media behavior
-
-Guidelines:
-- Be helpful, accurate, and professional
-- Focus on factual analysis rather than speculation
-- Suggest actionable insights for investigation
-- Explain technical concepts in accessible language
-- Always consider ethical implications of social media analysis
-- Respect privacy and avoid identifying specific individuals unless they are public figures
-- Provide balanced perspectives on controversial topics
-
-When analyzing data, consider:
-- Temporal patterns (when activity occurs)
-- Network structures (who connects to whom)
-- Content themes and keywords
-- Engagement patterns
-- Potential coordination indicators
-"""
-    
     def generate_data_summary(self, summary_stats: Dict[str, Any], 
                             top_keywords: List[tuple], 
                             top_contributors: pd.DataFrame,
@@ -143,40 +237,21 @@ When analyzing data, consider:
         Returns:
             Formatted data summary string
         """
-        # Format top keywords
-        keywords_text = ", ".join([f"{kw} ({count})" for kw, count in top_keywords[:10]])
-        
-        # Format top contributors
-        contributors_text = ""
-        if not top_contributors.empty:
-            contributors_text = ", ".join([
-                f"{row['author']} ({row['post_count']} posts, {row['percentage']:.1f}%)"
-                for _, row in top_contributors.head(5).iterrows()
-            ])
-        
-        summary = f"""
-CURRENT DATASET ANALYSIS:
-
-OVERVIEW:
-- Total Posts: {summary_stats.get('total_posts', 0):,}
-- Unique Authors: {summary_stats.get('unique_authors', 0):,}
-- Date Range: {summary_stats.get('date_range', 'N/A')}
-- Average Score: {summary_stats.get('avg_score', 0):.1f}
-- Total Comments: {summary_stats.get('total_comments', 0):,}
-
-TOP KEYWORDS: {keywords_text}
-
-TOP CONTRIBUTORS: {contributors_text}
-
-NETWORK ANALYSIS:
-- Nodes (Authors): {network_stats.get('nodes', 0)}
-- Connections: {network_stats.get('edges', 0)}
-- Network Density: {network_stats.get('density', 0):.3f}
-- Connected Components: {network_stats.get('connected_components', 0)}
-
-This data represents social media posts that have been filtered based on user selections. The user can ask questions about patterns, trends, or request analysis suggestions.
-"""
-        return summary
+        # Reduce the inputs to hashable tuples so that reruns with unchanged
+        # data reuse the formatted string instead of rebuilding it
+        contributor_rows = ()
+        if len(top_contributors):
+            contributor_rows = tuple(
+                top_contributors.head(5)[['author', 'post_count', 'percentage']]
+                .itertuples(index=False, name=None)
+            )
+        
+        return _format_data_summary(
+            tuple(sorted(summary_stats.items())),
+            tuple(top_keywords[:10]),
+            contributor_rows,
+            tuple(sorted(network_stats.items()))
+        )
     
     def chat(self, user_message: str, data_context: str = "") -> str:
         """
@@ -189,199 +264,344 @@ This data represents social media posts that have been filtered based on user se
         Returns:
             AI response string
         """
+        return "".join(self.chat_stream(user_message, data_context))
+    
+    def chat_stream(self, user_message: str, data_context: str = "", quick: bool = False) -> Iterator[str]:
+        """
+        Send a message to the AI and yield the response text as it arrives.
+        
+        Args:
+            user_message: User's question or message
+            data_context: Current data context/summary
+            quick: Whether this is a suggested quick question, which may be
+                answered from the sidebar's prefetched batch answers
+            
+        Yields:
+            Chunks of the AI response string
+        """
         if not self.initialized:
-            return "❌ Chatbot not initialized. Please provide a valid Gemini API key."
+            yield "❌ Chatbot not initialized. Please provide a valid Gemini API key."
+            return
         
         try:
-            # Combine data context with user message
-            full_message = f"""
-DATA CONTEXT:
-{data_context}
-
-USER QUESTION:
-{user_message}
-
-Please provide insights, analysis, or suggestions based on the current data and user question.
-"""
+            # The data context is only resent when it changed since the last message
+            full_message = f"{self._context_update(data_context)}[Q] {user_message}"
             
-            response = self.chat_session.send_message(full_message)
-            return response.text
+            # Answers depend on the conversation so far, so that is part of the key; a
+            # quick question is also answered by its conversation-independent batch answer
+            cache_key = _content_hash("chat", user_message, data_context, self._conversation_digest)
+            answer = self._chat_cache.get(cache_key)
+            if answer is not None:
+                self._chat_cache.move_to_end(cache_key)
+            elif quick:
+                answer = self._response_cache.get(_content_hash("quick", user_message, data_context))
+            if answer is not None:
+                self._record_cached_exchange(full_message, answer)
+                self._finish_exchange(user_message, data_context, answer)
+                yield answer
+                return
+            
+            # Streaming shows the first tokens long before the full answer is done
+            response = self._send_message(full_message)
+            chunks = []
+            completed = False
+            try:
+                for chunk in response:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+                completed = True
+            finally:
+                # Also covers the generator being closed before the stream ended
+                if not completed:
+                    self._rewind_conversation()
+            
+            # Only complete answers are cached; errors above skip this
+            answer = "".join(chunks)
+            self._chat_cache[cache_key] = answer
+            while len(self._chat_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                self._chat_cache.popitem(last=False)
+            self._finish_exchange(user_message, data_context, answer)
             
         except Exception as e:
-            return f"❌ Error generating response: {str(e)}"
+            yield f"❌ Error generating response: {str(e)}"
     
-    def get_suggested_questions(self, data_context: str) -> List[str]:
+    def _context_update(self, data_context: str) -> str:
         """
-        Generate suggested questions based on the current data.
+        Build the context block for a message, or nothing if the session already has it.
+        
+        The context is re-prefilled by Gemini on every turn it is sent, so it
+        is only included when it differs from the one last sent.
         
         Args:
             data_context: Current data summary
             
         Returns:
-            List of suggested questions
+            Minified [CONTEXT UPDATE] block, or an empty string
         """
-        if not self.initialized:
-            return [
-                "What patterns can you see in the posting times?",
-                "Who are the most influential contributors?",
-                "What topics are trending in this dataset?",
-                "Are there any signs of coordinated activity?",
-                "What investigation strategies would you recommend?"
-            ]
+        if _content_hash(data_context) == self._sent_context_hash:
+            return ""
+        return _context_block(data_context)
+    
+    def _context_sent(self, data_context: str) -> None:
+        """Record that the session has received this data context."""
+        self._sent_context_hash = _content_hash(data_context)
+    
+    def _finish_exchange(self, user_message: str, data_context: str, answer: str) -> None:
+        """Record a completed question and answer in the conversation state."""
+        self._context_sent(data_context)
+        self._conversation_digest = _content_hash(self._conversation_digest, user_message, answer)
+    
+    def _record_cached_exchange(self, message: str, answer: str) -> None:
+        """
+        Add an exchange answered from the cache to the chat session's history.
+        
+        Gemini never saw it, so without this a follow-up question would lack
+        the context of the answer the user is reading.
         
+        Args:
+            message: Message that would have been sent
+            answer: Cached answer shown to the user
+        """
+        self.chat_session.history = [
+            *self.chat_session.history,
+            {"role": "user", "parts": [message]},
+            {"role": "model", "parts": [answer]},
+        ]
+    
+    def _start_conversation(self) -> None:
+        """Start a new chat session with no history or sent context."""
+        self.chat_session = self.model.start_chat(history=[])
+        self._sent_context_hash = None
+        self._conversation_digest = ""
+    
+    def clear_cache(self) -> None:
+        """
+        Clear this session's cached chat answers and start a new conversation.
+        
+        The on-disk cache only holds answers derived from the data summary,
+        with no user input, and is shared with other browser sessions, so it
+        is left alone.
+        """
+        self._chat_cache.clear()
+        if self.initialized:
+            self._start_conversation()
+    
+    def _send_message(self, content: str):
+        """
+        Stream a message on the chat session, retrying once if starting it times out.
+        
+        No request timeout is set: for a stream it limits the whole answer,
+        not the wait for its first chunk.
+        
+        Args:
+            content: Message to send
+            
+        Returns:
+            Gemini response, an iterable of chunks
+        """
         try:
-            prompt = f"""
-Based on this social media data summary, suggest 5 specific, actionable questions that would help with investigative analysis:
-
-{data_context}
-
-Return only the questions, one per line, without numbering or bullets.
-"""
+            return self.chat_session.send_message(content, stream=True)
+        except _timeout_errors():
+            # Restart the session with the same history so a stuck call cannot linger
+            self.chat_session = self.model.start_chat(history=self.chat_session.history)
+            return self.chat_session.send_message(content, stream=True)
+    
+    def _rewind_conversation(self) -> None:
+        """
+        Drop an exchange whose stream did not finish.
+        
+        The chat session refuses further messages until the unfinished
+        exchange is rewound; if that fails, a new conversation is started.
+        """
+        try:
+            self.chat_session.rewind()
+        except Exception:
+            self._start_conversation()
+    
+    def _generate(self, prompt: str):
+        """
+        Send a one-off prompt outside the chat session, retrying once if it times out.
+        
+        The conversation history is neither used nor changed, so this is safe
+        to call from a background thread.
+        
+        Args:
+            prompt: Prompt to send
             
-            response = self.chat_session.send_message(prompt)
-            questions = [q.strip() for q in response.text.split('\n') if q.strip()]
-            return questions[:5]  # Limit to 5 questions
+        Returns:
+            Gemini response
+        """
+        request_options = {"timeout": self.request_timeout}
+        try:
+            return self.model.generate_content(prompt, request_options=request_options)
+        except _timeout_errors():
+            return self.model.generate_content(prompt, request_options=request_options)
+    
+    def _fetch_answers(self, questions: List[str], data_context: str) -> Dict[str, str]:
+        """
+        Ask Gemini for the uncached questions' answers in one stateless request.
+        
+        The data context is sent once for all questions instead of once per
+        question. Nothing is cached here, so the sidebar prefetch runs this on
+        a background thread and stores the answers from the script thread,
+        under the keys chat_stream(..., quick=True) checks.
+        
+        Args:
+            questions: Questions to answer
+            data_context: Current data summary
             
+        Returns:
+            Parsed answers keyed by their quick-question cache key
+        """
+        pending = [
+            (question, key) for question in questions
+            for key in [_content_hash("quick", question, data_context)]
+            if key not in self._response_cache
+        ]
+        if not pending:
+            return {}
+        
+        numbered_questions = "\n".join(f"{i}. {question}" for i, (question, _) in enumerate(pending, 1))
+        prompt = (
+            f"{_context_block(data_context)}[QUESTIONS]\n{numbered_questions}\n\n"
+            "Answer each numbered question, wrapped as <ANSWER i>...</ANSWER> where i is the question number."
+        )
+        
+        try:
+            response = self._generate(prompt)
+            answers = {int(i): answer.strip() for i, answer in self.ANSWER_PATTERN.findall(response.text)}
         except Exception:
-            # Fallback questions if AI fails
-            return [
-                "What patterns can you see in the posting times?",
-                "Who are the most influential contributors?",
-                "What topics are trending in this dataset?",
-                "Are there any signs of coordinated activity?",
-                "What investigation strategies would you recommend?"
-            ]
+            return {}  # Unanswered questions fall back to a regular chat_stream() call
+        
+        return {key: answers[i] for i, (_, key) in enumerate(pending, 1) if answers.get(i)}
+    
+    def _load_response_cache(self) -> "OrderedDict[str, Any]":
+        """
+        Load cached Gemini responses from disk.
+        
+        Returns:
+            Responses keyed by content hash, least recently used first
+        """
+        try:
+            with open(RESPONSE_CACHE_PATH, 'r', encoding='utf-8') as f:
+                return OrderedDict(json.load(f))
+        except (OSError, ValueError, TypeError):
+            # A missing or unreadable cache just starts empty
+            return OrderedDict()
+    
+    def _store_responses(self, responses: Dict[str, Any]) -> None:
+        """
+        Cache Gemini responses, evicting the least recently used entries.
+        
+        The cache file is shared by every browser session, so it is re-read and
+        merged with this session's entries before being rewritten.
+        
+        Args:
+            responses: Responses keyed by content hash of their prompt inputs
+        """
+        if not responses:
+            return
+        
+        with _RESPONSE_CACHE_LOCK:
+            merged = self._load_response_cache()
+            for key, response in self._response_cache.items():
+                merged.setdefault(key, response)
+            for key, response in responses.items():
+                merged[key] = response
+                merged.move_to_end(key)
+            while len(merged) > RESPONSE_CACHE_MAX_ENTRIES:
+                merged.popitem(last=False)
+            self._response_cache = merged
+            
+            # Write to a temporary file and rename it so a crash never leaves a torn cache
+            try:
+                cache_dir = os.path.dirname(os.path.abspath(RESPONSE_CACHE_PATH))
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache_dir,
+                                                 suffix='.tmp', delete=False) as f:
+                    json.dump(merged, f)
+                os.replace(f.name, RESPONSE_CACHE_PATH)
+            except OSError:
+                pass  # The in-memory cache still works without a writable directory
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _format_data_summary(summary_items: Tuple[Tuple[str, Any], ...],
+                         top_keywords: Tuple[tuple, ...],
+                         contributor_rows: Tuple[Tuple[str, int, float], ...],
+                         network_items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Format the data summary for the AI context, cached on its hashable inputs.
+    
+    Args:
+        summary_items: Sorted (name, value) pairs of the summary statistics
+        top_keywords: Up to 10 (keyword, count) tuples
+        contributor_rows: Up to 5 (author, post_count, percentage) tuples
+        network_items: Sorted (name, value) pairs of the network statistics
+        
+    Returns:
+        Formatted data summary string
+    """
+    summary_stats = dict(summary_items)
+    network_stats = dict(network_items)
+    
+    # Format top keywords
+    keywords_text = ", ".join([f"{kw} ({count})" for kw, count in top_keywords])
+    
+    # Format top contributors
+    contributors_text = ", ".join([
+        f"{author} ({post_count} posts, {percentage:.1f}%)"
+        for author, post_count, percentage in contributor_rows
+    ])
+    
+    summary = f"""
+CURRENT DATASET ANALYSIS:
+
+OVERVIEW:
+- Total Posts: {summary_stats.get('total_posts', 0):,}
+- Unique Authors: {summary_stats.get('unique_authors', 0):,}
+- Date Range: {summary_stats.get('date_range', 'N/A')}
+- Average Score: {summary_stats.get('avg_score', 0):.1f}
+- Total Comments: {summary_stats.get('total_comments', 0):,}
+
+TOP KEYWORDS: {keywords_text}
+
+TOP CONTRIBUTORS: {contributors_text}
+
+NETWORK ANALYSIS:
+- Nodes (Authors): {network_stats.get('nodes', 0)}
+- Connections: {network_stats.get('edges', 0)}
+- Network Density: {network_stats.get('density', 0):.3f}
+- Connected Components: {network_stats.get('connected_components', 0)}
+"""
+    return summary
 
 
-def render_floating_chat_button():
-    """Render floating chat button CSS and HTML."""
-    st.markdown("""
-    <style>
-    .floating-chat-container {
-        position: fixed;
-        bottom: 20px;
-        right: 20px;
-        z-index: 1000;
-        display: flex;
-        flex-direction: column;
-        align-items: flex-end;
-        gap: 10px;
-    }
-    
-    .chat-label {
-        background: rgba(0, 0, 0, 0.8);
-        color: white;
-        padding: 8px 12px;
-        border-radius: 20px;
-        font-size: 14px;
-        font-weight: 500;
-        white-space: nowrap;
-        opacity: 0;
-        transform: translateX(10px);
-        transition: all 0.3s ease;
-        pointer-events: none;
-    }
-    
-    .floating-chat-btn {
-        width: 70px;
-        height: 70px;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 50%;
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        justify-content: center;
-        cursor: pointer;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.2);
-        transition: all 0.3s ease;
-        border: none;
-        color: white;
-        font-size: 24px;
-        text-decoration: none;
-        position: relative;
-    }
-    
-    .floating-chat-btn:hover {
-        transform: scale(1.05);
-        box-shadow: 0 6px 25px rgba(0,0,0,0.3);
-    }
-    
-    .floating-chat-btn:hover + .chat-label,
-    .floating-chat-container:hover .chat-label {
-        opacity: 1;
-        transform: translateX(0);
-    }
-    
-    .chat-icon {
-        font-size: 28px;
-        margin-bottom: 2px;
-    }
-    
-    .chat-text {
-        font-size: 10px;
-        font-weight: bold;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        line-height: 1;
-    }
-    
-    .chat-status-indicator {
-        position: absolute;
-        top: 2px;
-        right: 2px;
-        width: 18px;
-        height: 18px;
-        border-radius: 50%;
-        border: 3px solid white;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 10px;
-    }
-    
-    .status-ready { 
-        background: #2ecc71;
-        animation: pulse-ready 2s infinite;
-    }
-    .status-setup { 
-        background: #f39c12;
-        animation: pulse-setup 2s infinite;
-    }
-    .status-error { 
-        background: #e74c3c; 
-    }
-    
-    @keyframes pulse-ready {
-        0% { box-shadow: 0 0 0 0 rgba(46, 204, 113, 0.7); }
-        70% { box-shadow: 0 0 0 10px rgba(46, 204, 113, 0); }
-        100% { box-shadow: 0 0 0 0 rgba(46, 204, 113, 0); }
-    }
-    
-    @keyframes pulse-setup {
-        0% { box-shadow: 0 0 0 0 rgba(243, 156, 18, 0.7); }
-        70% { box-shadow: 0 0 0 10px rgba(243, 156, 18, 0); }
-        100% { box-shadow: 0 0 0 0 rgba(243, 156, 18, 0); }
-    }
-    
-    /* Mobile responsive */
-    @media (max-width: 768px) {
-        .floating-chat-container {
-            bottom: 15px;
-            right: 15px;
-        }
-        .floating-chat-btn {
-            width: 60px;
-            height: 60px;
-        }
-        .chat-icon {
-            font-size: 24px;
-        }
-        .chat-text {
-            font-size: 9px;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
+def _fetch_suggested_questions(chatbot: GeminiChatbot, data_context: str) -> List[str]:
+    """
+    Ask Gemini for suggested questions about the data context.
+    
+    This runs on the prefetch executor, outside any Streamlit script run, so
+    it uses no Streamlit API: the sidebar memoises the result in the response
+    cache from the script thread instead. Failures raise instead of returning
+    the fallback questions, so that they are not cached and the next rerun
+    asks again.
+    
+    Args:
+        chatbot: Initialized GeminiChatbot
+        data_context: Current data summary
+        
+    Returns:
+        List of up to 5 suggested questions
+    """
+    prompt = (
+        f"{_context_block(data_context)}"
+        "Based on the current data summary, suggest 5 specific, actionable questions that would help with investigative analysis. "
+        "Return only the questions, one per line, without numbering or bullets."
+    )
+    
+    response = chatbot._generate(prompt)
+    questions = [q.strip() for q in response.text.split('\n') if q.strip()]
+    return questions[:5]  # Limit to 5 questions
 
 
 def render_chatbot_interface(chatbot: GeminiChatbot, 
@@ -433,6 +653,98 @@ def render_chatbot_interface(chatbot: GeminiChatbot,
         render_chat_sidebar(chatbot, summary_stats, top_keywords, top_contributors, network_stats)
 
 
+def prefetch_suggested_questions(chatbot: GeminiChatbot,
+                                 summary_stats: Dict[str, Any],
+                                 top_keywords: List[tuple],
+                                 top_contributors: pd.DataFrame,
+                                 network_stats: Dict[str, Any]) -> None:
+    """
+    Start fetching suggested questions in the background while the chat panel is open.
+    
+    Call this as soon as the analytics are ready, so the Gemini round-trip
+    overlaps with rendering the rest of the dashboard instead of blocking
+    the sidebar.
+    
+    Args:
+        chatbot: GeminiChatbot instance
+        summary_stats: Current summary statistics
+        top_keywords: Current top keywords
+        top_contributors: Current top contributors
+        network_stats: Current network statistics
+    """
+    if not (chatbot.initialized and st.session_state.get("chat_panel_open")):
+        return
+    
+    data_context = chatbot.generate_data_summary(
+        summary_stats, top_keywords, top_contributors, network_stats
+    )
+    _get_prefetch_futures(chatbot, data_context)
+
+
+def _get_prefetch_futures(chatbot: GeminiChatbot, data_context: str) -> Tuple[Future, Future]:
+    """
+    Return this session's background fetches for the data context, starting them if needed.
+    
+    The quick-question answers are fetched in one batch as soon as the
+    suggested questions arrive, without holding up the script thread.
+    
+    Args:
+        chatbot: GeminiChatbot instance
+        data_context: Current data summary
+        
+    Returns:
+        Futures resolving to the list of suggested questions and to the
+        answers of the first three, keyed by cache key
+    """
+    context_hash = _content_hash("questions", data_context)
+    prefetch = st.session_state.get("suggestions_prefetch")
+    
+    # A changed data context makes any earlier prefetch stale
+    if prefetch is None or prefetch[0] != context_hash:
+        # The worker only makes the request; the script thread caches the result
+        cached = chatbot._response_cache.get(context_hash)
+        if cached is not None:
+            suggestions = Future()
+            suggestions.set_result(list(cached))
+        else:
+            suggestions = _PREFETCH_EXECUTOR.submit(_fetch_suggested_questions, chatbot, data_context)
+        answers = _then(suggestions, lambda questions: chatbot._fetch_answers(questions[:3], data_context))
+        prefetch = (context_hash, suggestions, answers)
+        st.session_state.suggestions_prefetch = prefetch
+    
+    return prefetch[1], prefetch[2]
+
+
+def _then(future: Future, fn: Callable[[Any], Any]) -> Future:
+    """
+    Chain fn onto a future, running it on the prefetch executor once the future succeeds.
+    
+    Args:
+        future: Future whose result is passed to fn
+        fn: Function to call with that result
+        
+    Returns:
+        Future resolving to fn's result, or to the first exception raised
+    """
+    chained = Future()
+    
+    def run(result):
+        try:
+            chained.set_result(fn(result))
+        except Exception as e:
+            chained.set_exception(e)
+    
+    def submit(done: Future) -> None:
+        # Submit rather than run here, which may be on the script thread
+        if done.exception() is not None:
+            chained.set_exception(done.exception())
+        else:
+            _PREFETCH_EXECUTOR.submit(run, done.result())
+    
+    future.add_done_callback(submit)
+    return chained
+
+
 def render_chat_sidebar(chatbot: GeminiChatbot, 
                        summary_stats: Dict[str, Any],
                        top_keywords: List[tuple],
@@ -470,22 +782,18 @@ def render_chat_sidebar(chatbot: GeminiChatbot,
         
         # Initialize chat history
         if "chat_history" not in st.session_state:
-            st.session_state.chat_history = []
+            st.session_state.chat_history = deque(maxlen=CHAT_HISTORY_MAX_ENTRIES)
         
         # Quick questions
         st.markdown("**💡 Quick Questions:**")
-        suggested_questions = chatbot.get_suggested_questions(data_context)
-        
-        for i, question in enumerate(suggested_questions[:3]):  # Show only 3 in sidebar
-            if st.button(f"❓ {question[:40]}...", key=f"quick_{i}", help=question):
-                with st.spinner("🤔 AI thinking..."):
-                    ai_response = chatbot.chat(question, data_context)
-                    st.session_state.chat_history.append({
-                        "user": question,
-                        "ai": ai_response,
-                        "timestamp": datetime.now().strftime("%H:%M")
-                    })
-                    st.rerun()
+        if _get_prefetch_futures(chatbot, data_context)[0].done():
+            _render_quick_questions(chatbot, data_context)
+        else:
+            # Re-render only this block until the suggestions arrive, instead of
+            # blocking the script run on the background fetch
+            st.fragment(run_every=SUGGESTION_POLL_SECONDS)(_render_quick_questions)(
+                chatbot, data_context, poll=True
+            )
         
         # Custom question input
         user_question = st.text_input(
@@ -495,20 +803,14 @@ def render_chat_sidebar(chatbot: GeminiChatbot,
         )
         
         if st.button("📤 Send", key="sidebar_send") and user_question:
-            with st.spinner("🤔 AI thinking..."):
-                ai_response = chatbot.chat(user_question, data_context)
-                st.session_state.chat_history.append({
-                    "user": user_question,
-                    "ai": ai_response,
-                    "timestamp": datetime.now().strftime("%H:%M")
-                })
-                st.rerun()
+            stream_chat_response(chatbot, user_question, data_context)
+            st.rerun()
         
         # Chat history (recent 3 conversations)
         if st.session_state.chat_history:
             st.markdown("**💬 Recent Conversations:**")
             
-            recent_chats = st.session_state.chat_history[-3:]
+            recent_chats = list(st.session_state.chat_history)[-3:]
             
             for chat in reversed(recent_chats):
                 with st.expander(f"🙋 {chat['user'][:30]}... ({chat['timestamp']})"):
@@ -517,10 +819,74 @@ def render_chat_sidebar(chatbot: GeminiChatbot,
         
         # Clear chat button
         if st.session_state.chat_history and st.button("🗑️ Clear Chat", key="clear_sidebar_chat"):
-            st.session_state.chat_history = []
+            st.session_state.chat_history.clear()
+            chatbot.clear_cache()
             st.rerun()
 
 
+def _render_quick_questions(chatbot: GeminiChatbot, data_context: str, poll: bool = False) -> None:
+    """
+    Render the quick-question buttons from the prefetched suggestions.
+    
+    Args:
+        chatbot: GeminiChatbot instance
+        data_context: Current data summary
+        poll: Whether this runs as a polling fragment, which reruns the whole
+            app once the suggestions have arrived
+    """
+    suggestions, answers = _get_prefetch_futures(chatbot, data_context)
+    if poll and suggestions.done():
+        st.rerun()  # The full run renders the result and stops the polling
+    
+    if not suggestions.done():
+        st.caption("⏳ Fetching suggestions for this data...")
+        suggested_questions = list(_FALLBACK_QUESTIONS[:3])
+    elif suggestions.exception() is not None:
+        # Drop the failed fetch so the next rerun asks again
+        st.session_state.pop("suggestions_prefetch", None)
+        suggested_questions = list(_FALLBACK_QUESTIONS[:3])
+    else:
+        questions = suggestions.result()
+        context_hash = _content_hash("questions", data_context)
+        if context_hash not in chatbot._response_cache:
+            chatbot._store_responses({context_hash: questions})
+        suggested_questions = questions[:3]  # Show only 3 in sidebar
+    
+    # All quick questions are answered in one background request; once it is done,
+    # its answers are cached and clicking a question needs no request of its own
+    if answers.done() and answers.exception() is None:
+        chatbot._store_responses({
+            key: answer for key, answer in answers.result().items()
+            if key not in chatbot._response_cache
+        })
+    
+    for i, question in enumerate(suggested_questions):
+        if st.button(f"❓ {question[:40]}...", key=f"quick_{i}", help=question):
+            stream_chat_response(chatbot, question, data_context, quick=True)
+            st.rerun()
+
+
+def stream_chat_response(chatbot: GeminiChatbot, question: str, data_context: str,
+                         quick: bool = False) -> None:
+    """
+    Stream an AI answer into the sidebar as it arrives and add it to the chat history.
+    
+    Args:
+        chatbot: GeminiChatbot instance
+        question: User's question
+        data_context: Current data summary
+        quick: Whether the question is one of the suggested quick questions
+    """
+    with st.spinner("🤔 AI thinking..."):
+        ai_response = st.write_stream(chatbot.chat_stream(question, data_context, quick=quick))
+    
+    st.session_state.chat_history.append({
+        "user": question,
+        "ai": ai_response,
+        "timestamp": datetime.now().strftime("%H:%M")
+    })
+
+
 def render_api_key_setup(chatbot: GeminiChatbot) -> None:
     """Render API key setup interface in sidebar."""
     
@@ -2,22 +2,29 @@
 Simple script to run the Social Media Analytics Dashboard
 """
 
-import subprocess
+import importlib.util
 import sys
 import os
 
+def preflight_skipped():
+    """Check if the launch checks are disabled via STREAMLIT_SKIP_PREFLIGHT=1."""
+    return os.environ.get("STREAMLIT_SKIP_PREFLIGHT") == "1"
+
 def check_dependencies():
     """Check if all required dependencies are installed."""
+    if preflight_skipped():
+        return True
+    
     required_packages = [
         'streamlit', 'plotly', 'pandas', 'networkx', 'pyvis'
     ]
     
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec only asks the import system whether a package exists,
+    # without actually importing it into the launcher process
+    missing_packages = [
+        package for package in required_packages
+        if importlib.util.find_spec(package) is None
+    ]
     
     if missing_packages:
         print(f"Missing packages: {', '.join(missing_packages)}")
@@ -28,8 +35,11 @@ def check_dependencies():
 
 def check_data_file():
     """Check if the data file exists."""
+    if preflight_skipped():
+        return True
+    
     data_file = "data/data.jsonl"
-    if not os.path.exists(data_file):
+    if not os.path.isfile(data_file):
         print(f"Data file not found: {data_file}")
         print("Please ensure the data file exists before running the dashboard.")
         return False
@@ -47,10 +57,20 @@ def run_dashboard():
     print("Dashboard will open in your default browser at http://localhost:8501")
     print("Press Ctrl+C to stop the dashboard")
     
-    try:
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "app.py"])
-    except KeyboardInterrupt:
-        print("\nDashboard stopped.")
+    command = [sys.executable, "-m", "streamlit", "run", "app.py"]
+    if os.name == 'nt':
+        # Windows has no exec: execvp would start a separate process and return
+        import subprocess
+        try:
+            subprocess.run(command)
+        except KeyboardInterrupt:
+            print("\nDashboard stopped.")
+        return
+    
+    sys.stdout.flush()  # exec discards anything still buffered
+    
+    # Replace this process with Streamlit instead of waiting on a child
+    os.execvp(sys.executable, command)
 
 if __name__ == "__main__":
     run_dashboard()
\ No newline at end of file
@@ -4,18 +4,231 @@ Creates
 interactive Plotly charts and network visualizations.
 """
 
-import plotly.express as px
+import plotly.colors
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
 import networkx as nx
-from pyvis.network import Network
+from analytics import DAYS_OF_WEEK
 import streamlit as st
-from typing import List, Dict, Any
-import tempfile
-import os
-import uuid
-import time
+from typing import List, Dict, Any, Optional
+import copy
+import functools
+import heapq
+import importlib.util
+
+# numba and pyvis are slow to import, so they are only loaded on first use
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+
+# Spread of the precomputed network layout, in vis.js canvas pixels
+NETWORK_LAYOUT_SCALE = 1000
+
+# vis.js options for the network. Positions are precomputed, so physics and
+# vis.js's own layout pass are off; smooth edges are disabled too since their
+# default type relies on physics
+NETWORK_OPTIONS = {
+    "physics": {"enabled": False},
+    "layout": {"improvedLayout": False},
+    "edges": {"smooth": False}
+}
+
+# Network node colour and tooltip wording per node type:
+# (color, type name, what the node's degree counts)
+NODE_STYLES = {
+    'author': ('#3498db', 'Author', 'Connections'),  # Blue for authors
+    'subreddit': ('#e67e22', 'Subreddit', 'Authors'),  # Orange for subreddits
+}
+UNKNOWN_NODE_STYLE = ('#95a5a6', 'Node', 'Connections')  # Gray for unknown
+
+# Contributors beyond this many are grouped into an "Other" pie slice
+MAX_PIE_SLICES = 20
+
+# Longer line traces are downsampled to this many points before plotting
+MAX_LINE_POINTS = 2000
+
+
+def downsample_lttb(x: np.ndarray, y: np.ndarray, n_out: int = MAX_LINE_POINTS) -> np.ndarray:
+    """
+    Pick the points that best preserve a line's shape (Largest-Triangle-Three-Buckets).
+    
+    The first and last points are always kept. The points in between are split
+    into n_out - 2 equal buckets, and from each bucket the point forming the
+    largest triangle with the previously kept point and the next bucket's mean
+    is kept.
+    
+    Args:
+        x: Sorted x values (numeric or datetime64)
+        y: y values
+        n_out: Number of points to keep
+        
+    Returns:
+        Sorted indices of the points to keep
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    x = x.astype('int64') if np.issubdtype(x.dtype, np.datetime64) else x
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    
+    # Bucket edges over the interior points 1..n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    if NUMBA_AVAILABLE:
+        return _get_lttb_compiled()(x, y, edges)
+    return _lttb_vectorized(x, y, edges)
+
+
+def _lttb_vectorized(x: np.ndarray, y: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """LTTB over float64 arrays with one numpy pass per bucket."""
+    n_out = len(edges) + 1
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, len(x) - 1
+    
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Mean of the next bucket, or the last point for the final bucket
+        if i + 2 < len(edges):
+            next_x = x[end:edges[i + 2]].mean()
+            next_y = y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        
+        # Twice the triangle area; only the argmax matters
+        areas = np.abs(
+            (x[prev] - next_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (next_y - y[prev])
+        )
+        prev = start + int(np.argmax(areas))
+        keep[i + 1] = prev
+    
+    return keep
+
+
+def _lttb_loops(x: np.ndarray, y: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """LTTB over float64 arrays as plain scalar loops, for compiling with numba."""
+    n_out = len(edges) + 1
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[n_out - 1] = len(x) - 1
+    
+    prev = 0
+    for i in range(n_out - 2):
+        start = edges[i]
+        end = edges[i + 1]
+        # Mean of the next bucket, or the last point for the final bucket
+        if i + 2 < len(edges):
+            next_end = edges[i + 2]
+            next_x = 0.0
+            next_y = 0.0
+            for j in range(end, next_end):
+                next_x += x[j]
+                next_y += y[j]
+            next_x /= next_end - end
+            next_y /= next_end - end
+        else:
+            next_x = x[len(x) - 1]
+            next_y = y[len(y) - 1]
+        
+        # Twice the triangle area; only the argmax matters
+        best = start
+        best_area = -1.0
+        for j in range(start, end):
+            area = abs(
+                (x[prev] - next_x) * (y[j] - y[prev])
+                - (x[prev] - x[j]) * (next_y - y[prev])
+            )
+            if area > best_area:
+                best_area = area
+                best = j
+        prev = best
+        keep[i + 1] = prev
+    
+    return keep
+
+
+_lttb_compiled = None
+
+
+def _get_lttb_compiled():
+    """Import numba and compile the LTTB kernel on first use."""
+    global _lttb_compiled
+    if _lttb_compiled is None:
+        from numba import njit
+        # cache=True keeps the compiled kernel on disk across Streamlit restarts
+        _lttb_compiled = njit(cache=True)(_lttb_loops)
+    return _lttb_compiled
+
+
+# Date axis for x values given as epoch milliseconds; plotly.js formats
+# only the visible ticks, picking a finer format as the user zooms in
+DATE_AXIS = dict(
+    type='date',
+    tickformatstops=[
+        dict(dtickrange=[None, 86400000], value="%b %d\n%H:%M"),
+        dict(dtickrange=[86400000, "M1"], value="%b %d"),
+        dict(dtickrange=["M1", "M12"], value="%b %Y"),
+        dict(dtickrange=["M12", None], value="%Y"),
+    ]
+)
+
+
+def to_epoch_ms(dates: np.ndarray) -> np.ndarray:
+    """
+    Convert datetime64 values to integer epoch milliseconds for plotting.
+    
+    Numbers serialize much faster and smaller than the ISO strings plotly
+    writes for every datetime sample; a DATE_AXIS displays them as dates.
+    
+    Args:
+        dates: datetime64 values
+        
+    Returns:
+        int64 milliseconds since the epoch
+    """
+    return dates.astype('datetime64[ms]').view('int64')
+
+
+@functools.lru_cache(maxsize=32)
+def _empty_figure_spec(title: str, message: str, height: int,
+                       xaxis_title: Optional[str], yaxis_title: Optional[str]) -> Dict[str, Any]:
+    """Build an empty figure with a centred message once and keep it as a dict."""
+    fig = go.Figure()
+    fig.add_annotation(
+        text=message,
+        xref="paper", yref="paper",
+        x=0.5, y=0.5, xanchor='center', yanchor='middle',
+        showarrow=False, font=dict(size=16)
+    )
+    fig.update_layout(title=title, height=height)
+    if xaxis_title or yaxis_title:
+        fig.update_layout(xaxis_title=xaxis_title, yaxis_title=yaxis_title)
+    return fig.to_dict()
+
+
+def empty_figure(title: str, message: str, height: int = 400,
+                 xaxis_title: Optional[str] = None, yaxis_title: Optional[str] = None) -> go.Figure:
+    """
+    Create a placeholder figure showing a message instead of data.
+    
+    The figure is built and validated once per set of arguments; later calls
+    copy the stored spec without re-validating it, which is several times
+    faster than building the figure again.
+    
+    Args:
+        title: Plot title
+        message: Text shown in the middle of the plot
+        height: Plot height in pixels
+        xaxis_title: Optional x-axis title
+        yaxis_title: Optional y-axis title
+        
+    Returns:
+        Plotly figure object, safe for the caller to modify
+    """
+    spec = _empty_figure_spec(title, message, height, xaxis_title, yaxis_title)
+    return go.Figure(spec, _validate=False)
 
 
 class SocialMediaVisualizations:
@@ -23,7 +236,7 @@ class SocialMediaVisualizations:
     
     def __init__(self):
         # Set consistent color palette
-        self.color_palette = px.colors.qualitative.Set3
+        self.color_palette = plotly.colors.qualitative.Set3
     
     def create_time_series_plot(self, time_series_data: pd.DataFrame, 
                                title: str = "Post Volume Over Time") -> go.Figure:
@@ -39,42 +252,33 @@ class SocialMediaVisualizations:
         """
         if time_series_data.empty:
             # Create empty plot with message
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No data available for the selected filters",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, xanchor='center', yanchor='middle',
-                showarrow=False, font=dict(size=16)
-            )
-            fig.update_layout(
-                title=title,
-                xaxis_title="Date",
-                yaxis_title="Number of Posts",
-                height=400
+            return empty_figure(
+                title, "No data available for the selected filters",
+                xaxis_title="Date", yaxis_title="Number of Posts"
             )
-            return fig
         
-        fig = px.line(
-            time_series_data, 
-            x='date', 
-            y='post_count',
-            title=title,
-            labels={'post_count': 'Number of Posts', 'date': 'Date'}
-        )
+        # Build traces directly from numpy arrays; plotly.express spends most of
+        # its time inspecting the DataFrame and grouping it into traces
+        dates = time_series_data['date'].to_numpy()
+        post_counts = time_series_data['post_count'].to_numpy()
+        keep = downsample_lttb(dates, post_counts)
+        fig = go.Figure(go.Scattergl(
+            x=to_epoch_ms(dates[keep]),
+            y=post_counts[keep],
+            mode='lines',
+            hovertemplate='<b>Date:</b> %{x}<br><b>Posts:</b> %{y}<extra></extra>'
+        ))
         
         # Customize layout
         fig.update_layout(
+            title=title,
             height=400,
             hovermode='x unified',
+            xaxis=DATE_AXIS,
             xaxis_title="Date",
             yaxis_title="Number of Posts"
         )
         
-        # Add hover information
-        fig.update_traces(
-            hovertemplate='<b>Date:</b> %{x}<br><b>Posts:</b> %{y}<extra></extra>'
-        )
-        
         return fig
     
     def create_keyword_trends_plot(self, keyword_data: pd.DataFrame,
@@ -90,28 +294,29 @@ class SocialMediaVisualizations:
             Plotly figure object
         """
         if keyword_data.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No keyword data available",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, xanchor='center', yanchor='middle',
-                showarrow=False, font=dict(size=16)
-            )
-            fig.update_layout(title=title, height=400)
-            return fig
-        
-        fig = px.line(
-            keyword_data,
-            x='created_at',
-            y='count',
-            color='keyword',
-            title=title,
-            labels={'count': 'Mentions', 'created_at': 'Date', 'keyword': 'Keyword'}
-        )
+            return empty_figure(title, "No keyword data available")
+        
+        # One line per keyword, in order of first appearance
+        traces = []
+        for keyword, group in keyword_data.groupby('keyword', sort=False, observed=True):
+            dates = group['created_at'].to_numpy()
+            counts = group['count'].to_numpy()
+            keep = downsample_lttb(dates, counts)
+            traces.append(go.Scattergl(
+                x=to_epoch_ms(dates[keep]),
+                y=counts[keep],
+                mode='lines',
+                name=keyword,
+                hovertemplate='Keyword=%{fullData.name}<br>Date=%{x}<br>Mentions=%{y}<extra></extra>'
+            ))
+        fig = go.Figure(data=traces)
         
         fig.update_layout(
+            title=title,
+            legend_title_text="Keyword",
             height=400,
             hovermode='x unified',
+            xaxis=DATE_AXIS,
             xaxis_title="Date",
             yaxis_title="Number of Mentions"
         )
@@ -131,45 +336,49 @@ class SocialMediaVisualizations:
             Plotly figure object
         """
         if contributors_data.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No contributor data available",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, xanchor='center', yanchor='middle',
-                showarrow=False, font=dict(size=16)
-            )
-            fig.update_layout(title="Top Contributors", height=400)
-            return fig
+            return empty_figure("Top Contributors", "No contributor data available")
         
         if chart_type == "pie":
-            fig = px.pie(
-                contributors_data,
-                values='post_count',
-                names='author',
-                title="Top Contributors by Post Count",
-                hover_data=['percentage']
-            )
+            # Keep the largest contributors and fold the rest into one slice;
+            # browsers struggle to draw pies with hundreds of slices
+            if len(contributors_data) > MAX_PIE_SLICES:
+                top = contributors_data.nlargest(MAX_PIE_SLICES, 'post_count')
+                rest = contributors_data.drop(top.index)
+                other = pd.DataFrame({
+                    'author': [f"Other ({len(rest)} authors)"],
+                    'post_count': [rest['post_count'].sum()],
+                    'percentage': [rest['percentage'].sum()]
+                })
+                contributors_data = pd.concat([top, other], ignore_index=True)
             
-            fig.update_traces(
+            fig = go.Figure(go.Pie(
+                values=contributors_data['post_count'].to_numpy(),
+                labels=contributors_data['author'].to_numpy(),
+                customdata=contributors_data[['percentage']].to_numpy(),
                 hovertemplate='<b>%{label}</b><br>Posts: %{value}<br>Percentage: %{customdata[0]:.1f}%<extra></extra>'
-            )
+            ))
+            fig.update_layout(title="Top Contributors by Post Count")
         
         else:  # bar chart
-            fig = px.bar(
-                contributors_data,
-                x='author',
-                y='post_count',
-                title="Top Contributors by Post Count",
-                labels={'post_count': 'Number of Posts', 'author': 'Author'},
-                hover_data=['percentage', 'avg_score']
-            )
-            
-            fig.update_traces(
+            fig = go.Figure(go.Bar(
+                x=contributors_data['author'].to_numpy(),
+                y=contributors_data['post_count'].to_numpy(),
+                customdata=contributors_data[['percentage', 'avg_score']].to_numpy(),
                 hovertemplate='<b>%{x}</b><br>Posts: %{y}<br>Percentage: %{customdata[0]:.1f}%<br>Avg Score: %{customdata[1]:.1f}<extra></extra>'
-            )
+            ))
             
-            # Rotate x-axis labels for better readability
-            fig.update_layout(xaxis_tickangle=-45)
+            # Rotate x-axis labels for better readability; bars keep the
+            # ranking order of the data rather than being sorted by name
+            fig.update_layout(
+                title="Top Contributors by Post Count",
+                xaxis=dict(
+                    title="Author",
+                    tickangle=-45,
+                    categoryorder='array',
+                    categoryarray=contributors_data['author'].tolist()
+                ),
+                yaxis_title="Number of Posts"
+            )
         
         fig.update_layout(height=400)
         return fig
@@ -185,44 +394,35 @@ class SocialMediaVisualizations:
             Plotly figure object
         """
         if rhythm_data.empty:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No posting rhythm data available",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, xanchor='center', yanchor='middle',
-                showarrow=False, font=dict(size=16)
-            )
-            fig.update_layout(title="Weekly Posting Rhythm", height=400)
-            return fig
+            return empty_figure("Weekly Posting Rhythm", "No posting rhythm data available")
         
         # Create bar chart
-        fig = px.bar(
-            rhythm_data,
-            x='day_of_week',
-            y='post_count',
-            title="Weekly Posting Rhythm",
-            labels={'day_of_week': 'Day of Week', 'post_count': 'Number of Posts'},
-            color='post_count',
-            color_continuous_scale='Blues'
-        )
+        post_counts = rhythm_data['post_count'].to_numpy()
+        fig = go.Figure(go.Bar(
+            x=rhythm_data['day_of_week'].to_numpy(),
+            y=post_counts,
+            marker=dict(
+                color=post_counts,
+                colorscale='Blues',
+                showscale=True,
+                colorbar=dict(title="Number of Posts")
+            ),
+            hovertemplate='<b>%{x}</b><br>Posts: %{y}<extra></extra>'
+        ))
         
-        # Customize layout
+        # Customize layout, keeping days in calendar order
         fig.update_layout(
+            title="Weekly Posting Rhythm",
             height=400,
-            xaxis_title="Day of Week",
+            xaxis=dict(
+                title="Day of Week",
+                categoryorder='array',
+                categoryarray=DAYS_OF_WEEK
+            ),
             yaxis_title="Number of Posts",
             showlegend=False
         )
         
-        # Update hover template
-        fig.update_traces(
-            hovertemplate='<b>%{x}</b><br>Posts: %{y}<extra></extra>'
-        )
-        
-        # Ensure days are in correct order
-        days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        fig.update_xaxes(categoryorder='array', categoryarray=days_order)
-        
         return fig
     
 
@@ -242,6 +442,8 @@ class SocialMediaVisualizations:
         if graph.number_of_nodes() == 0:
             return "<div style='text-align: center; padding: 50px;'>No network data available for the selected filters</div>"
         
+        from pyvis.network import Network
+        
         # Create PyVis network
         net = Network(
             height="500px",
@@ -250,93 +452,47 @@ class SocialMediaVisualizations:
             font_color="black"
         )
         
-        # Add nodes with sizing based on degree centrality
-        degrees = dict(graph.degree())
-        max_degree = max(degrees.values()) if degrees else 1
+        # Add nodes with sizing based on degree centrality, held as parallel
+        # id/degree arrays so the sizes are computed in one numpy pass
+        node_ids, degree_values = zip(*graph.degree())
+        degree_values = np.asarray(degree_values, dtype=np.int32)
+        max_degree = degree_values.max()
+        # Scale factor for node sizes; a graph without edges gets the minimum size
+        size_scale = 30.0 / max_degree if max_degree else 0.0
+        node_sizes = (10.0 + degree_values * size_scale).tolist()
+        
+        # Lay the graph out here so the browser doesn't have to run the force simulation
+        positions = nx.spring_layout(graph, seed=42, iterations=50, scale=NETWORK_LAYOUT_SCALE)
         
-        for node in graph.nodes(data=True):
-            node_id, node_data = node
-            # Size nodes based on their degree (number of connections)
-            node_size = 10 + (degrees.get(node_id, 0) / max_degree) * 30
+        for node_id, degree, node_size in zip(node_ids, degree_values.tolist(), node_sizes):
+            node_data = graph.nodes[node_id]
             
-            # Determine node type and color
-            if node_data.get('node_type') == 'author':
-                color = '#3498db'  # Blue for authors
-                label = node_data.get('label', node_id)
-                title = f"Author: {label}<br>Connections: {degrees.get(node_id, 0)}"
-            elif node_data.get('node_type') == 'subreddit':
-                color = '#e67e22'  # Orange for subreddits
-                label = node_data.get('label', node_id)
-                title = f"Subreddit: {label}<br>Authors: {degrees.get(node_id, 0)}"
-            else:
-                color = '#95a5a6'  # Gray for unknown
-                label = str(node_id)
-                title = f"Node: {label}<br>Connections: {degrees.get(node_id, 0)}"
+            # Determine node type and color with a single lookup
+            color, type_name, degree_name = NODE_STYLES.get(node_data.get('node_type'), UNKNOWN_NODE_STYLE)
+            label = str(node_data.get('label', node_id))
             
+            x, y = positions[node_id]
             net.add_node(
                 node_id,
                 label=label,
                 size=node_size,
-                title=title,
-                color=color
-            )
-        
-        # Add edges with thickness based on weight
-        for edge in graph.edges(data=True):
-            source, target, data = edge
-            weight = data.get('weight', 1)
-            post_count = data.get('post_count', weight)
-            
-            # Create edge title with connection information
-            edge_title = f"Posts: {post_count}"
-            
-            net.add_edge(
-                source,
-                target,
-                width=min(weight, 10),  # Cap width for readability
-                title=edge_title
+                title=f"{type_name}: {label}<br>{degree_name}: {degree}",
+                color=color,
+                x=float(x),
+                y=float(y),
+                physics=False
             )
         
-        # Configure physics
-        net.set_options("""
-        var options = {
-          "physics": {
-            "enabled": true,
-            "stabilization": {"iterations": 100}
-          }
-        }
-        """)
+        # PyVis passes a dict of options to vis.js as-is, with no JSON string to parse;
+        # each network gets its own copy so the module constant can never be changed
+        net.options = copy.deepcopy(NETWORK_OPTIONS)
         
         # Generate HTML
         try:
-            # Method 1: Try using PyVis's built-in HTML generation
+            # Method 1: Try using PyVis's built-in HTML generation, kept in memory
             try:
-                # Use a unique filename to avoid conflicts
-                temp_filename = f"network_{uuid.uuid4().hex}.html"
-                temp_path = os.path.join(tempfile.gettempdir(), temp_filename)
-                
-                # Save the graph
-                net.save_graph(temp_path)
-                
-                # Read the generated HTML
-                html_content = ""
-                with open(temp_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                # Clean up temporary file with retry logic
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        if os.path.exists(temp_path):
-                            os.unlink(temp_path)
-                        break
-                    except (OSError, PermissionError):
-                        if attempt < max_retries - 1:
-                            time.sleep(0.1)  # Brief delay before retry
-                        # If all retries fail, just continue (file will be cleaned up by system)
-                
-                return html_content
-                
+                self._add_network_edges(net, graph)
+                return net.generate_html(notebook=False)
             except Exception:
                 # Method 2: Fallback - generate simple HTML manually
                 return self._generate_fallback_network_html(graph)
@@ -344,6 +500,46 @@ class SocialMediaVisualizations:
         except Exception as e:
             return f"<div style='text-align: center; padding: 50px;'>Error generating network visualization: {str(e)}</div>"
     
+    def _add_network_edges(self, net, graph: nx.Graph) -> None:
+        """
+        Add the graph's edges to a PyVis network, with thickness based on weight.
+        
+        networkx edges are already unique, so the records are appended directly:
+        add_edge rescans every existing edge for a duplicate on each call, which
+        is quadratic over the whole graph. This relies on the edge records of the
+        pyvis version pinned in requirements.txt.
+        
+        Args:
+            net: PyVis network already holding the graph's nodes
+            graph: NetworkX graph object
+            
+        Raises:
+            ValueError: If an edge endpoint is not a node of the network
+        """
+        from pyvis.edge import Edge
+        
+        edges = list(graph.edges(data=True))
+        
+        # The same endpoint check that add_edge makes, once for all edges
+        net_nodes = set(net.get_nodes())
+        for source, target, _ in edges:
+            if source not in net_nodes or target not in net_nodes:
+                raise ValueError(f"Edge {source!r} - {target!r} has an endpoint that is not a network node")
+        
+        weights = [data.get('weight', 1) for _, _, data in edges]
+        # Cap width for readability, for all edges in one numpy call
+        widths = np.minimum(np.asarray(weights), 10).tolist()
+        net.edges.extend(
+            Edge(
+                source,
+                target,
+                net.directed,
+                width=width,
+                title=f"Posts: {data.get('post_count', weight)}"
+            ).options
+            for (source, target, data), weight, width in zip(edges, weights, widths)
+        )
+    
     def _generate_fallback_network_html(self, graph: nx.Graph) -> str:
         """
         Generate a simple fallback network visualization when PyVis fails.
@@ -360,9 +556,10 @@ class SocialMediaVisualizations:
         # Count node types
         authors = [n for n, d in graph.nodes(data=True) if d.get('node_type') == 'author']
         subreddits = [n for n, d in graph.nodes(data=True) if d.get('node_type') == 'subreddit']
+        degrees = dict(graph.degree())
         
-        # Generate simple HTML table
-        html = f"""
+        # Generate simple HTML table, collecting the pieces and joining them once
+        parts = [f"""
         <div style='padding: 20px; font-family: Arial, sans-serif;'>
             <h3>Network Overview</h3>
             <p><strong>Authors:</strong> {len(authors)} | <strong>Subreddits:</strong> {len(subreddits)} | <strong>Connections:</strong> {graph.number_of_edges()}</p>
@@ -371,33 +568,27 @@ class SocialMediaVisualizations:
                 <div style='flex: 1;'>
                     <h4>👤 Top Authors</h4>
                     <ul>
-        """
+        """]
         
         # Add top authors by degree
-        author_degrees = [(n, graph.degree(n)) for n in authors]
-        author_degrees.sort(key=lambda x: x[1], reverse=True)
-        
-        for author, degree in author_degrees[:5]:
+        for author in heapq.nlargest(5, authors, key=degrees.get):
             author_name = graph.nodes[author].get('label', author)
-            html += f"<li>{author_name} ({degree} subreddits)</li>"
+            parts.append(f"<li>{author_name} ({degrees[author]} subreddits)</li>")
         
-        html += """
+        parts.append("""
                     </ul>
                 </div>
                 <div style='flex: 1;'>
                     <h4>📋 Top Subreddits</h4>
                     <ul>
-        """
+        """)
         
         # Add top subreddits by degree
-        subreddit_degrees = [(n, graph.degree(n)) for n in subreddits]
-        subreddit_degrees.sort(key=lambda x: x[1], reverse=True)
-        
-        for subreddit, degree in subreddit_degrees[:5]:
+        for subreddit in heapq.nlargest(5, subreddits, key=degrees.get):
             subreddit_name = graph.nodes[subreddit].get('label', subreddit)
-            html += f"<li>{subreddit_name} ({degree} authors)</li>"
+            parts.append(f"<li>{subreddit_name} ({degrees[subreddit]} authors)</li>")
         
-        html += """
+        parts.append("""
                     </ul>
                 </div>
             </div>
@@ -406,9 +597,9 @@ class SocialMediaVisualizations:
                 Interactive visualization temporarily unavailable. Network data shown above.
             </p>
         </div>
-        """
+        """)
         
-        return html
+        return "".join(parts)
     
     def create_summary_metrics_cards(self, stats: Dict[str, Any]) -> None:
         """
@@ -459,24 +650,17 @@ def create_top_keywords_chart(keywords: List[tuple], title: str = "Top Keywords"
         Plotly figure object
     """
     if not keywords:
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No keywords found",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, xanchor='center', yanchor='middle',
-            showarrow=False, font=dict(size=16)
-        )
-        fig.update_layout(title=title, height=300)
-        return fig
+        return empty_figure(title, "No keywords found", height=300)
     
     words, counts = zip(*keywords)
     
+    # numpy arrays take plotly's fast validation path; tuples are checked element by element
     fig = go.Figure(data=[
         go.Bar(
-            x=counts,
-            y=words,
+            x=np.asarray(counts),
+            y=np.asarray(words, dtype=object),
             orientation='h',
-            marker_color=px.colors.qualitative.Set3[0]
+            marker_color=plotly.colors.qualitative.Set3[0]
         )
     ])
     